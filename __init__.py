@@ -1,14 +1,22 @@
 from binaryninja import Architecture, BinaryViewType, enums
 
-from .superh import SuperH, EM_SH, DefaultCallingConv
+from .superh import ARCHITECTURES, BIG_ENDIAN_ARCHITECTURES, EM_SH, DefaultCallingConv
+
+for arch_class in ARCHITECTURES + BIG_ENDIAN_ARCHITECTURES:
+    arch_class.register()
+    variant_arch = Architecture[arch_class.name]
+    variant_arch.register_calling_convention(DefaultCallingConv(variant_arch, 'default'))
+    variant_arch.standalone_platform.default_calling_convention = variant_arch.calling_conventions['default']
 
-SuperH.register()
 arch = Architecture['superh']
-arch.register_calling_convention(DefaultCallingConv(arch, 'default'))
-arch.standalone_platform.default_calling_convention = arch.calling_conventions['default']
 
 BinaryViewType['ELF'].register_arch(
     EM_SH,
     enums.Endianness.LittleEndian,
     arch
-)
\ No newline at end of file
+)
+BinaryViewType['ELF'].register_arch(
+    EM_SH,
+    enums.Endianness.BigEndian,
+    Architecture['superh-be']
+)
@@ -0,0 +1,70 @@
+import random
+import struct
+import sys
+import tracemalloc
+
+from bootstrap import plugin_module
+
+disasm = plugin_module("disasm")
+
+if len(sys.argv) > 1:
+    with open(sys.argv[1], "rb") as fd:
+        image = fd.read()
+else:
+    rng = random.Random(0x5348)
+    image = bytes(rng.getrandbits(8) for _ in range(0x8000))
+
+image = image[:len(image) & ~1]
+base = 0x5000
+
+
+class CountingBytes(bytes):
+    """bytes that counts how often it is indexed or sliced"""
+    slices = 0
+
+    def __getitem__(self, key):
+        CountingBytes.slices += 1
+        return super().__getitem__(key)
+
+
+def slicing_read(raw_insn, addr):
+    """Reference: the first halfword read the way the decoder used to"""
+    return struct.unpack("<H", raw_insn[:2])[0]
+
+
+# Binary Ninja hands the decoder up to max_instr_length bytes per call,
+# built here before anything is measured
+windows = [CountingBytes(image[off:off + 4]) for off in range(0, len(image), 2)]
+
+CountingBytes.slices = 0
+for off, raw_insn in enumerate(windows):
+    disasm.disasm_single(raw_insn, base + off * 2)
+print(f"disasm_single: {CountingBytes.slices} slices of the input "
+      f"in {len(windows)} decodes")
+
+
+def measure(name, decode):
+    """Bytes kept and bytes only allocated temporarily per decode"""
+    kept = list()
+    retained = 0
+    transient = 0
+
+    tracemalloc.start()
+    for off, raw_insn in enumerate(windows):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        kept.append(decode(raw_insn, base + off * 2))
+        current, peak = tracemalloc.get_traced_memory()
+        retained += current - before
+        transient += peak - current
+    tracemalloc.stop()
+
+    count = len(windows)
+    print(f"{name:>14}: {retained / count:7.1f} bytes kept, "
+          f"{transient / count:5.1f} bytes temporary per decode")
+
+
+# The measurement itself allocates, the no-op row is that overhead
+measure("no-op", lambda raw_insn, addr: None)
+measure("slicing read", slicing_read)
+measure("disasm_single", disasm.disasm_single)
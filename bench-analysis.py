@@ -0,0 +1,49 @@
+import sys
+import time
+
+import binaryninja
+
+# Headless: run once per plugin revision on the same image and compare
+if len(sys.argv) < 2:
+    print(f"usage: {sys.argv[0]} <image>")
+    sys.exit(1)
+
+start = time.perf_counter()
+bv = binaryninja.load(sys.argv[1], update_analysis=False)
+if bv is None:
+    print(f"Failed to open {sys.argv[1]}")
+    sys.exit(1)
+load_time = time.perf_counter() - start
+
+start = time.perf_counter()
+bv.update_analysis_and_wait()
+analysis_time = time.perf_counter() - start
+
+functions = list(bv.functions)
+blocks = sum(len(func.basic_blocks) for func in functions)
+
+# Phantom functions created from bogus branch targets tend to start on odd
+# addresses or outside of any executable segment
+bogus = 0
+for func in functions:
+    seg = bv.get_segment_at(func.start)
+    if func.start & 1 or seg is None or not seg.executable:
+        bogus += 1
+
+print(f"arch: {bv.arch.name if bv.arch else None}")
+print(f"load: {load_time:.3f}s")
+print(f"analysis: {analysis_time:.3f}s")
+print(f"functions: {len(functions)}")
+print(f"basic blocks: {blocks}")
+print(f"bogus function starts: {bogus}")
+
+# The plugin is loaded by Binary Ninja under its directory name
+superh = next((
+    module for name, module in list(sys.modules.items())
+    if name.endswith(".superh") and hasattr(module, "memo_stats")
+), None)
+if superh is not None:
+    stats = superh.memo_stats()
+    requested = stats.hits + stats.misses
+    print(f"decodes requested: {requested}")
+    print(f"decodes run: {stats.misses} ({requested / max(stats.misses, 1):.1f}x fewer)")
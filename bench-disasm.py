@@ -0,0 +1,123 @@
+import random
+import sys
+import time
+
+from bootstrap import plugin_module
+
+disasm = plugin_module("disasm")
+try:
+    classify = plugin_module("classify")
+except ImportError:
+    classify = None
+
+from_file = len(sys.argv) > 1
+if from_file:
+    with open(sys.argv[1], "rb") as fd:
+        image = fd.read()
+else:
+    rng = random.Random(0x5348)
+    image = bytes(rng.getrandbits(8) for _ in range(0x20000))
+
+image = image[:len(image) & ~1]
+base = 0x5000
+
+
+def scan_disasm(raw_insn, addr):
+    """Reference decoder: the linear OPCODES scan the lookup table replaced"""
+    insn_int = int.from_bytes(raw_insn[:2], "little")
+    for opcode in disasm.OPCODES:
+        if opcode["size"] != 2:
+            continue
+        instbits, instmask = opcode['opmask']
+        if insn_int & instmask == instbits:
+            return disasm._decode(opcode, insn_int, addr)
+    return None
+
+
+def run(name, decode):
+    start = time.perf_counter()
+    decoded = 0
+    for off in range(0, len(image), 2):
+        if decode(image[off:off + 2], base + off) is not None:
+            decoded += 1
+    elapsed = time.perf_counter() - start
+    count = len(image) // 2
+    print(f"{name:>8}: {count} halfwords, {decoded} decoded, "
+          f"{elapsed:.3f}s ({count / elapsed:,.0f} insn/s)")
+    return elapsed
+
+
+start = time.perf_counter()
+disasm._build_decode16()
+print(f"table build: {time.perf_counter() - start:.3f}s")
+
+def sweep_single():
+    insns = 0
+    off = 0
+    while off < len(image):
+        insn = disasm.disasm_single(image[off:off + 4], base + off)
+        if insn is None:
+            off += 2
+            continue
+        insns += 1
+        off += insn.size
+    return insns
+
+
+def sweep_range():
+    insns = 0
+    for _ in disasm.disasm_range(image, base):
+        insns += 1
+    return insns
+
+
+def sweep_cached():
+    insns = 0
+    for _ in disasm.disasm_range(image, base, decode=cache):
+        insns += 1
+    return insns
+
+
+def run_sweep(name, sweep):
+    start = time.perf_counter()
+    insns = sweep()
+    elapsed = time.perf_counter() - start
+    print(f"{name:>8}: {insns} insns, {elapsed:.3f}s "
+          f"({len(image) / elapsed / 1024 / 1024:.2f} MB/s)")
+    return elapsed
+
+
+scan_time = run("scan", scan_disasm)
+table_time = run("table", disasm.disasm_single)
+print(f"speedup: {scan_time / table_time:.1f}x")
+
+print("\nlinear sweep:")
+single_time = run_sweep("single", sweep_single)
+range_time = run_sweep("range", sweep_range)
+print(f"speedup: {single_time / range_time:.1f}x")
+
+# The second pass over the image is what repeated analysis of the same
+# code sees
+cache = disasm.DecodeCache()
+print("\ncached range sweep:")
+run_sweep("cold", sweep_cached)
+cached_time = run_sweep("warm", sweep_cached)
+print(f"speedup: {range_time / cached_time:.1f}x vs range")
+print(f"  {cache.stats()}")
+
+start = time.perf_counter()
+valid = 0
+for off in range(0, len(image), 2):
+    valid += disasm.is_valid(image[off] | (image[off + 1] << 8))
+elapsed = time.perf_counter() - start
+print(f"\nis_valid: {valid} of {len(image) // 2} halfwords valid, {elapsed:.3f}s")
+
+if classify is not None:
+    words = classify.words_from_bytes(image)
+    start = time.perf_counter()
+    result = classify.classify(words)
+    elapsed = time.perf_counter() - start
+    print(f"\nclassify: {len(words)} halfwords, {result.invalid} invalid, "
+          f"{elapsed:.3f}s ({len(words) / elapsed:,.0f} halfwords/s)")
+    top = sorted(result.counts.items(), key=lambda item: -item[1])[:10]
+    print("  " + ", ".join(f"{cmd} {count}" for cmd, count in top))
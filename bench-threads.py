@@ -0,0 +1,60 @@
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bootstrap import plugin_module
+
+disasm = plugin_module("disasm")
+
+if len(sys.argv) > 1:
+    with open(sys.argv[1], "rb") as fd:
+        image = fd.read()
+else:
+    rng = random.Random(0x5348)
+    image = bytes(rng.getrandbits(8) for _ in range(0x80000))
+
+image = image[:len(image) & ~1]
+base = 0x5000
+thread_counts = (1, 2, 4, 8)
+
+
+def decode_chunk(start, end):
+    """What an analysis thread does per instruction: decode and render"""
+    text = list()
+    for insn in disasm.disasm_range(image, base, start, end):
+        text.append(insn.insn_str)
+    return text
+
+
+def chunks(count):
+    """Split the image into count halfword aligned slices"""
+    step = (len(image) // count) & ~1
+    bounds = [idx * step for idx in range(count)] + [len(image)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+print(f"{len(image)} bytes, GIL {'enabled' if gil else 'disabled'}")
+
+# Every thread count splits the image at the same boundaries, so the
+# output must match the single threaded run exactly
+slices = chunks(max(thread_counts))
+reference = [decode_chunk(start, end) for start, end in slices]
+
+first = None
+for threads in thread_counts:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(lambda bounds: decode_chunk(*bounds), slices))
+        elapsed = time.perf_counter() - start
+
+    if results != reference:
+        print(f"{threads} threads: output differs from the single threaded run")
+        sys.exit(1)
+
+    insns = sum(len(text) for text in results)
+    if first is None:
+        first = elapsed
+    print(f"{threads:>2} threads: {insns} insns, {elapsed:.3f}s "
+          f"({insns / elapsed:,.0f} insn/s, {first / elapsed:.2f}x)")
@@ -0,0 +1,20 @@
+"""Module lookup for the scripts that ship next to the plugin
+
+The scripts run from inside the plugin directory, where disasm.py and the
+other modules are plain top-level files. Import them as submodules of the
+plugin package instead, so their relative imports resolve.
+"""
+import importlib
+import os
+import sys
+
+PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGIN = os.path.basename(PLUGIN_DIR)
+
+if os.path.dirname(PLUGIN_DIR) not in sys.path:
+    sys.path.insert(0, os.path.dirname(PLUGIN_DIR))
+
+
+def plugin_module(name):
+    """Import the plugin module called name, e.g. "disasm\""""
+    return importlib.import_module(PLUGIN + "." + name)
@@ -0,0 +1,31 @@
+import os
+import sys
+import time
+
+from bootstrap import plugin_module
+
+shidx = plugin_module("shidx")
+
+if len(sys.argv) < 2:
+    print(f"usage: {sys.argv[0]} <raw_image.bin> [base_addr] [out.shidx]")
+    sys.exit(1)
+
+base = int(sys.argv[2], 0) if len(sys.argv) > 2 else 0
+path = sys.argv[3] if len(sys.argv) > 3 else sys.argv[1] + ".shidx"
+
+with open(sys.argv[1], "rb") as fd:
+    image = fd.read()
+image = image[:len(image) & ~1]
+
+start = time.perf_counter()
+header = shidx.write(path, image, base)
+build_time = time.perf_counter() - start
+
+start = time.perf_counter()
+index = shidx.open_index(path)
+open_time = time.perf_counter() - start
+
+valid = int((index.records["id"] != shidx.INVALID).sum())
+print(f"{path}: {header.count} halfwords, {valid} decode, "
+      f"{os.path.getsize(path) / 1024 / 1024:.1f} MB")
+print(f"build: {build_time:.3f}s, reopen: {open_time:.3f}s")
@@ -0,0 +1,111 @@
+import sys
+
+from bootstrap import plugin_module
+
+disasm = plugin_module("disasm")
+superh = plugin_module("superh")
+
+from binaryninja import Architecture, LowLevelILFunction
+
+
+def lift(insn, arch="superh"):
+    il = LowLevelILFunction(Architecture[arch])
+    superh.Lifter.lift(il, insn)
+    return [il[idx] for idx in range(len(il))]
+
+
+def check_range_end_past_buffer():
+    # nop, nop and half of a third one
+    buffer = bytes.fromhex("0900090009")
+    insns = list(disasm.disasm_range(buffer, 0x1000, end=0x100))
+    assert [insn.addr for insn in insns] == [0x1000, 0x1002], insns
+    assert all(insn.insn_str.strip() == "nop" for insn in insns), insns
+
+
+
+def check_tbr_table_call_scaled():
+    # jsr/n @@(0x10,TBR) calls through the pointer at TBR + 0x40
+    insn = disasm.disasm_single(bytes.fromhex("1083"), 0x1000)
+    mem, = insn.memory
+    assert mem.kind == disasm.AddrMode.DISP_TBR and mem.scale == 4, mem
+    call, = lift(insn)
+    assert call.operation.name == "LLIL_CALL", call
+    assert "0x40" in str(call), call
+
+
+def check_pre_dec_store_of_base():
+    # mov.l R15,@-R15 stores R15 from before the decrement
+    insn = disasm.disasm_single(bytes.fromhex("f62f"), 0x1000)
+    store, step = lift(insn)
+    assert store.operation.name == "LLIL_STORE", (store, step)
+    assert step.operation.name == "LLIL_SET_REG", (store, step)
+
+
+
+def check_reserved_dsp_register_invalid():
+    # movs.w with Ds = 0 and padd X0,Y0,Dz with Dz = 0 are reserved
+    dsp = disasm.variant_decoders("DSP")
+    assert disasm.disasm_single(bytes.fromhex("0df4"), 0x1000, decoders=dsp) is None
+    assert disasm.disasm_single(bytes.fromhex("00f8c0b1"), 0x1000, decoders=dsp) is None
+    # Dz = 7 is A0
+    insn = disasm.disasm_single(bytes.fromhex("00f8c7b1"), 0x1000, decoders=dsp)
+    assert insn is not None and insn.operands[2].reg == "A0", insn
+
+
+def check_parallel_transfer_not_lifted_as_nop():
+    # nopx movy.w A0,@R6 stores A0, it must not lift as a nop
+    insn = disasm.disasm_single(
+        bytes.fromhex("11f0"), 0x1000, decoders=disasm.variant_decoders("DSP")
+    )
+    assert insn.parallel, insn
+    unimpl, = lift(insn, "sh-dsp")
+    assert unimpl.operation.name == "LLIL_UNIMPL", unimpl
+
+
+def check_cache_relocates_to_address():
+    # bra, mov.l @(disp,PC),R1 and mova @(disp,PC),R0 depend on the address,
+    # and on addr & 3 for the PC-relative loads
+    cache = disasm.DecodeCache()
+    for raw in ("23a1", "05d1", "03c7"):
+        for addr in (0x1000, 0x2002, 0x3000, 0x4006):
+            cached = disasm.disasm_single(bytes.fromhex(raw), addr, decode=cache)
+            plain = disasm.disasm_single(bytes.fromhex(raw), addr)
+            assert cached == plain, (raw, hex(addr), cached.insn_str, plain.insn_str)
+    stats = cache.stats()
+    assert stats.misses == 3 and stats.hits == 9, stats
+
+
+def check_memo_decodes_changed_bytes():
+    # Patching the bytes at an address, even in the same buffer, decodes again
+    memo = disasm.DecodeMemo(disasm.disasm_single)
+    data = bytearray.fromhex("0900")
+    assert memo(data, 0x1000).insn_str.strip() == "nop"
+    data[:] = bytes.fromhex("0b00")
+    assert memo(data, 0x1000).insn_str.strip() == "rts"
+    assert memo(data, 0x1000).insn_str.strip() == "rts"
+    assert (memo.hits, memo.misses) == (1, 2), (memo.hits, memo.misses)
+
+
+def check_memo_slot_collision():
+    # Addresses 16384 halfwords apart share a slot, each replaces the other
+    memo = disasm.DecodeMemo(disasm.disasm_single, slots=1 << 14)
+    nop = bytes.fromhex("0900")
+    far = 0x1000 + (1 << 14) * 2
+    assert memo(nop, 0x1000).addr == 0x1000
+    assert memo(nop, far).addr == far
+    assert memo(nop, 0x1000).addr == 0x1000
+    assert (memo.hits, memo.misses) == (0, 3), (memo.hits, memo.misses)
+
+checks = [value for name, value in list(globals().items()) if name.startswith("check_")]
+failed = 0
+for check in checks:
+    try:
+        check()
+    except AssertionError as exc:
+        print(f"FAIL {check.__name__}: {exc}")
+        failed += 1
+    else:
+        print(f"ok   {check.__name__}")
+
+if failed:
+    sys.exit(1)
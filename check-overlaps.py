@@ -0,0 +1,134 @@
+import sys
+
+from bootstrap import plugin_module
+
+disasm = plugin_module("disasm")
+overlap = plugin_module("overlap")
+
+OPCODES = disasm.OPCODES
+family_names = {
+    overlap.FAMILY_BASE: "base",
+    overlap.FAMILY_FPU_PAIR: "fpu-pair",
+    overlap.FAMILY_DSP: "dsp",
+    overlap.FAMILY_DSP_Y: "dsp-y",
+}
+
+
+def describe(idx):
+    opcode = OPCODES[idx]
+    text = ''.join(fmt for _, fmt in opcode["tokens"])
+    width = opcode["size"] * 2
+    instbits, instmask = opcode['opmask']
+    return (f"#{idx:<3} {instbits:0{width}x}/{instmask:0{width}x} "
+            f"{family_names[overlap.family(opcode)]:<8} {text}")
+
+
+def lookup(word, size, mode=0, decoders=disasm.DECODERS):
+    decode16, prefix32, alu16 = decoders[mode]
+    if size == 2:
+        opcode = decode16[word]
+    elif prefix32[word >> 16] is disasm.PARALLEL:
+        opcode = alu16[word & 0xffff]
+    else:
+        opcode = None
+        for cand in prefix32[word >> 16] or ():
+            instbits, instmask = cand['opmask']
+            if word & instmask == instbits:
+                opcode = cand
+                break
+    if opcode is None:
+        return None
+    return opcode["id"]
+
+pairs = list(overlap.find_overlaps(OPCODES))
+counts = dict()
+for _, _, rel in pairs:
+    counts[rel] = counts.get(rel, 0) + 1
+
+print(f"{len(OPCODES)} opcodes, {len(pairs)} overlapping pairs")
+for rel in sorted(counts):
+    print(f"  {rel}: {counts[rel]}")
+
+print("\nAmbiguous encodings (resolved by rule, not specificity):")
+for i, j, rel in overlap.ambiguous(OPCODES):
+    word = overlap.witness(OPCODES[i], OPCODES[j])
+    print(f"  {rel:<9} @ {word:x}")
+    print(f"    {describe(i)}")
+    print(f"    {describe(j)}")
+
+# 16-bit words that decode differently than a first match scan of OPCODES
+first_match = [None] * 0x10000
+for idx, opcode in enumerate(OPCODES):
+    if opcode["size"] != 2:
+        continue
+    instbits, instmask = opcode['opmask']
+    for word in overlap.encodings(instbits, instmask, 0xffff):
+        if first_match[word] is None and not disasm.has_reserved_regs(opcode, word):
+            first_match[word] = idx
+
+changed = dict()
+for word in range(0x10000):
+    got = lookup(word, 2)
+    if got != first_match[word]:
+        key = (first_match[word], got)
+        changed[key] = changed.get(key, 0) + 1
+
+print(f"\nPriority order changes {sum(changed.values())} 16-bit words vs OPCODES order:")
+for (was, now), count in sorted(changed.items()):
+    print(f"  {count:>5} words")
+    print(f"    was {describe(was)}")
+    print(f"    now {describe(now)}")
+
+mode_names = {
+    0: "default",
+    overlap.MODE_PR: "PR",
+    overlap.MODE_SZ: "SZ",
+    overlap.MODE_SZ | overlap.MODE_PR: "SZ+PR",
+}
+
+
+
+def accepts(opcode, word):
+    return not disasm.has_reserved_regs(opcode, word)
+
+# 32-bit encodings that can never decode because a valid 16-bit decode of
+# their first halfword wins, modes with the same result are listed together
+print("\n32-bit opcodes hidden behind 16-bit encodings of their first halfword:")
+for variant in (None,) + disasm.VARIANTS:
+    by_hidden = dict()
+    for mode in overlap.FPU_MODES:
+        order = [
+            idx for idx in overlap.priority_order(OPCODES, mode)
+            if variant is None or variant in OPCODES[idx]["isa"]
+        ]
+        hidden = tuple(overlap.hidden_32bit(OPCODES, order, accepts))
+        by_hidden.setdefault(hidden, list()).append(mode_names[mode])
+    for hidden, modes in by_hidden.items():
+        if not hidden:
+            continue
+        print(f"  {variant or 'all variants'} in {', '.join(modes)} mode:")
+        for idx, count, total in hidden:
+            print(f"    {describe(idx)}: {count} of {total} first halfwords")
+
+failed = False
+for variant in (None,) + disasm.VARIANTS:
+    decoders = disasm.variant_decoders(variant)
+    for mode in overlap.FPU_MODES:
+        order = [
+            idx for idx in overlap.priority_order(OPCODES, mode)
+            if variant is None or variant in OPCODES[idx]["isa"]
+        ]
+        mismatches = overlap.check_decoder(
+            OPCODES, order, lambda word, size: lookup(word, size, mode, decoders), accepts
+        )
+        if mismatches:
+            print(f"\nDecoder disagrees with the priority order for "
+                  f"{variant or 'all variants'} in {mode_names[mode]} mode:")
+            for word, want, got in mismatches:
+                print(f"  {word:x}: expected {want}, got {got}")
+            failed = True
+
+if failed:
+    sys.exit(1)
+
+print("Decoder tables agree with the priority order for every ISA variant and FPU mode")
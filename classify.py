@@ -0,0 +1,80 @@
+"""Whole-region opcode classification with NumPy
+
+For triage of large images: every halfword of a region is mapped to the
+ID of the opcode it decodes as in one vectorised pass, without building an
+SHInsn per instruction. Classification is per halfword position, not a
+linear sweep, so the second halfword of a 32-bit instruction is also
+classified on its own.
+
+NumPy is only needed by this module, the plugin itself does not import it.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .disasm import OPCODES, PRIORITY, DECODE16, PREFIX32, ALU16, PARALLEL
+
+# Index value for halfwords that do not start any valid encoding
+INVALID = -1
+
+Classification = namedtuple("Classification", ("index", "counts", "invalid"))
+
+def _build_index16(table):
+    """A 65536 entry opcode table as an int16 array of opcode IDs"""
+    return np.fromiter(
+        (INVALID if opcode is None else opcode["id"] for opcode in table),
+        dtype=np.int16,
+        count=0x10000
+    )
+
+INDEX16 = _build_index16(DECODE16)
+
+# SH-DSP ALU operations by second halfword, for the first halfwords PREFIX32
+# marks PARALLEL. Like DECODE16 it leaves out reserved register encodings.
+INDEX_ALU16 = _build_index16(ALU16)
+IS_PARALLEL = np.array([cands is PARALLEL for cands in PREFIX32], dtype=bool)
+
+# Halfwords that can start a 32-bit instruction
+HAS_PREFIX32 = np.array([cands is not None for cands in PREFIX32], dtype=bool)
+
+# (id, instbits, instmask) for the 32-bit opcodes in PRIORITY order
+_OPS32 = tuple(
+    (opcode["id"],) + opcode['opmask']
+    for opcode in PRIORITY if opcode["size"] == 4
+)
+
+def words_from_bytes(buffer, byteorder="<"):
+    """View a bytes-like region as an array of halfwords, without copying"""
+    return np.frombuffer(buffer, dtype=byteorder + "u2", count=len(buffer) // 2)
+
+def classify(words):
+    """Map every halfword of words (a uint16 array) to an opcode ID
+
+    Returns a Classification of the int16 index array (INVALID where no
+    encoding matches), a dict of counts per mnemonic and the number of
+    invalid halfwords.
+    """
+    words = np.asarray(words, dtype=np.uint16)
+    index = INDEX16[words]
+
+    # Only halfwords that are not a 16-bit instruction but can start a
+    # 32-bit one look at the next halfword
+    pos = np.flatnonzero((index[:-1] == INVALID) & HAS_PREFIX32[words[:-1]])
+    if pos.size:
+        insn = (words[pos].astype(np.uint32) << 16) | words[pos + 1]
+        found = np.full(pos.size, INVALID, dtype=np.int16)
+        parallel = IS_PARALLEL[words[pos]]
+        found[parallel] = INDEX_ALU16[words[pos + 1][parallel]]
+        for opcode_id, instbits, instmask in _OPS32:
+            hit = ~parallel & (found == INVALID) & ((insn & instmask) == instbits)
+            found[hit] = opcode_id
+        index[pos] = found
+
+    per_opcode = np.bincount(index[index != INVALID], minlength=len(OPCODES))
+    counts = dict()
+    for idx in np.flatnonzero(per_opcode):
+        cmd = OPCODES[idx]["cmd"]
+        counts[cmd] = counts.get(cmd, 0) + int(per_opcode[idx])
+
+    invalid = int(np.count_nonzero(index == INVALID))
+    return Classification(index, counts, invalid)
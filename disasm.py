@@ -1,105 +1,858 @@
+import functools
+import re
 import struct
+import sys
+import threading
+from collections import namedtuple
+from enum import Enum
 
 from binaryninja import (
     InstructionTextToken,
     InstructionTextTokenType
 )
 
-from .opcodes import OPCODES, OpType, Oper
+from .opcodes import OPCODES, OpType, Oper, DSP_PARALLEL
+from .overlap import encodings, priority_order, FPU_MODES, MODE_PR, MODE_SZ
 
 
-class SHInsn:
-    def __init__(self, opcode, raw_insn, addr):
-        self.opcode = opcode
-        self.args = dict()
-        self.insn_str = ""
-        self.tokens = list()
-        self.size = opcode["size"]
-        self.raw_insn = raw_insn
-        self.addr = addr
+def _runs(mask):
+    """Split mask into (mask, shift) steps, one per contiguous run of bits
 
-    def parse_it(self):
-        self._parse_args()
-        return self._stringify()
+    OR-ing (word & mask) >> shift over the steps packs the masked bits of
+    word together, so split fields (the movi20 immediate spans both
+    halfwords) come out with the lowest run lowest.
+    """
+    steps = list()
+    pos = 0
+    while mask:
+        low = mask & -mask
+        run = mask & ~(mask + low)
+        shift = low.bit_length() - 1
+        steps.append((run, shift - pos))
+        pos += bin(run).count("1")
+        mask ^= run
+    return steps
 
-    def _stringify(self):
-        for token in self.opcode["tokens"]:
-            (toke_type, fmt) = token
+def _pc_relative(opcode):
+    """Index of the @(disp,PC) operand pair in opcode["args"], or None"""
+    args = opcode["args"]
+    for idx in range(len(args) - 1):
+        oper = args[idx]
+        if oper.type == OpType.DISP and oper.is_ref and oper.is_pair \
+                and args[idx + 1].fmt_str == 'PC':
+            return idx
+    return None
 
-            text = fmt.format(
-                n=self.args['n'],
-                m=self.args['m'],
-                imm=self.args['imm'],
-                disp=self.args['disp']
-            )
+# SH-DSP parallel instructions: the X and Y data transfers and the ALU
+# operations whose first halfword carries an X/Y transfer pair in its low
+# 10 bits
+_PARALLEL_X = frozenset(DSP_PARALLEL['x'])
+_PARALLEL_Y = frozenset(DSP_PARALLEL['y'])
+_PARALLEL_ALU = frozenset(DSP_PARALLEL['alu'])
 
-            self.tokens.append((toke_type, text))
-            self.insn_str += text
+# Parallel parts by those 10 bits: the Y transfer next to an X transfer and
+# the transfers next to an ALU operation. nopx and nopy are left out, an X
+# part brings its own Y part along. Filled in once PRIORITY is known.
+_MOVES_Y = [()] * 0x400
+_MOVES_XY = [()] * 0x400
 
-        for operand in self.opcode["args"]:
-            if operand.type == OpType.REG:
-                operand.reg = operand.fmt_str.format(n=self.args['n'], m=self.args['m'])
-            elif operand.type == OpType.IMM:
-                operand.val = self.args['imm']
-            elif operand.type == OpType.DISP:
-                operand.val = self.args['disp']
+# Decoded fields of an instruction in SHInsn.fields: m, n, imm, disp, the
+# resolved @(disp,PC) address ea and the SH-DSP register fields
+FIELD_NAMES = ('m', 'n', 'imm', 'disp', 'ea', 'A', 'D', 'x', 'y', 'z', 'e', 'f', 'g', 'u')
+FIELD_INDEX = {name: idx for idx, name in enumerate(FIELD_NAMES)}
+_DISP = FIELD_INDEX['disp']
+_EA = FIELD_INDEX['ea']
 
-        return True
+class Fields(namedtuple("Fields", FIELD_NAMES)):
+    """Field values of a decoded instruction, None for fields it does not have"""
+    __slots__ = ()
 
-    def _parse_args(self):
-        """Given an instruction and an opcode, return a dict representing them"""
-        if self.opcode['m'][0] != 0:
-            self.args['m'] = (self.raw_insn & self.opcode['m'][0]) >> self.opcode['m'][1]
-        else:
-            self.args['m'] = None
-        if self.opcode['n'][0] != 0:
-            self.args['n'] = (self.raw_insn & self.opcode['n'][0]) >> self.opcode['n'][1]
-        else:
-            self.args['n'] = None
-        if self.opcode['imm'][0] != 0:
-            self.args['imm'] = (self.raw_insn & self.opcode['imm'][0]) >> self.opcode['imm'][1]
+_make_fields = Fields._make
+
+class FieldLayout(namedtuple("FieldLayout", ("template", "steps", "sign", "label", "pcrel", "parallel"))):
+    """How to extract the Fields of an opcode, see _compile_fields()"""
+    __slots__ = ()
+
+def _compile_fields(opcode):
+    """Precompute how to extract the operand fields of opcode
+
+    Returns a FieldLayout: template holds a value per FIELD_NAMES entry, 0
+    if the opcode has the field and None otherwise, steps are (index, mask,
+    shift) to OR into it and sign is the sign bit of a signed disp (or 0). label is a (scale, offset) pair turning disp
+    into an absolute target and pcrel a (scale, align) pair resolving
+    @(disp,PC) into ea, both None when unused. parallel is a (shift,
+    table) pair for SH-DSP instructions with parallel parts, the bits of
+    the X/Y transfers are (raw_insn >> shift) & 0x3ff.
+    """
+    template = [None] * len(FIELD_NAMES)
+    steps = list()
+
+    for key in ('m', 'n', 'imm'):
+        mask = opcode[key][0]
+        if mask != 0:
+            idx = FIELD_INDEX[key]
+            template[idx] = 0
+            steps.extend((idx, run, shift) for run, shift in _runs(mask))
+    for key, (mask, _) in opcode['dsp'].items():
+        idx = FIELD_INDEX[key]
+        template[idx] = 0
+        steps.extend((idx, run, shift) for run, shift in _runs(mask))
+
+    sign = 0
+    disp_mask, disp_scale, disp_signed = opcode['disp']
+    if disp_mask != 0:
+        template[_DISP] = 0
+        steps.extend((_DISP, run, shift) for run, shift in _runs(disp_mask))
+        if disp_signed:
+            sign = 1 << (bin(disp_mask).count("1") - 1)
+
+    label = (disp_scale, 4) if opcode["is_label"] else None
+
+    pcrel = None
+    if _pc_relative(opcode) is not None:
+        align = 0xfffffffc if disp_scale == 4 else 0xffffffff
+        template[_EA] = 0
+        pcrel = (disp_scale, align)
+
+    parallel = None
+    if opcode["id"] in _PARALLEL_X:
+        parallel = (0, _MOVES_Y)
+    elif opcode["id"] in _PARALLEL_ALU:
+        parallel = (16, _MOVES_XY)
+
+    return FieldLayout(tuple(template), tuple(steps), sign, label, pcrel, parallel)
+
+# {name references to a field in the token templates of OPCODES
+_FIELD_REF = re.compile(r"\{(" + "|".join(FIELD_NAMES) + r")\b")
+
+def _compile_listing(opcode):
+    """Token templates for the listing as (type, fmt, field, names)
+
+    Register tokens resolve through REG_NAMES: field and names are set for
+    registers picked by a field, every other token is fmt.format()ed with
+    the Fields. @(disp,PC) operands are shown as @(target) with the
+    resolved address.
+    """
+    tokens = opcode["tokens"]
+
+    if _pc_relative(opcode) is not None:
+        for idx in range(len(tokens) - 4):
+            texts = tuple(fmt for _, fmt in tokens[idx:idx + 5])
+            if texts == ('@(', '0x{disp:x}', ', ', 'PC', ')'):
+                tokens = tokens[:idx + 1] + (
+                    (InstructionTextTokenType.PossibleAddressToken, '0x{ea:x}'),
+                ) + tokens[idx + 4:]
+                break
+
+    listing = list()
+    for toke_type, fmt in tokens:
+        field = names = None
+        if toke_type == InstructionTextTokenType.RegisterToken and fmt in REG_NAMES:
+            field, names = REG_NAMES[fmt]
+            if field is None:
+                fmt = names
+                names = None
+        if field is None:
+            fmt = _FIELD_REF.sub(lambda match: "{0." + match.group(1), fmt)
+        listing.append((toke_type, fmt, field, names))
+    return tuple(listing)
+
+class SHOperand(namedtuple("SHOperand", ("oper", "fields"))):
+    """A decoded operand: the read-only Oper from OPCODES and the insn fields
+
+    Nothing is formatted, val is a plain field lookup and reg indexes the
+    interned names in REG_NAMES.
+    """
+    __slots__ = ()
+
+    @property
+    def type(self):
+        return self.oper.type
+
+    @property
+    def reg(self):
+        field, names = REG_NAMES[self.oper.fmt_str]
+        if field is None:
+            return names
+        return names[self.fields[field]]
+
+    @property
+    def val(self):
+        if self.oper.type == OpType.IMM:
+            return self.fields.imm
+        if self.oper.type == OpType.DISP:
+            return self.fields.disp
+        return None
+
+    @property
+    def value(self):
+        """Register name, number or raw operand text depending on type"""
+        if self.oper.type == OpType.REG:
+            return self.reg
+        if self.oper.type == OpType.UNKNOWN:
+            return self.oper.fmt_str
+        return self.val
+
+    @property
+    def fmt_str(self):
+        return self.oper.fmt_str
+
+    @property
+    def is_ref(self):
+        return self.oper.is_ref
+
+    @property
+    def is_pair(self):
+        return self.oper.is_pair
+
+    @property
+    def mod_reg(self):
+        return self.oper.mod_reg
+
+    @property
+    def size(self):
+        return self.oper.size
+
+class SHInsn(namedtuple("SHInsn", ("opcode", "raw_insn", "addr", "fields", "operands", "parallel"),
+                        defaults=((),))):
+    """A decoded instruction, never modified after decode so safe to share
+
+    fields is the read-only Fields with the extracted m, n, imm and disp
+    values, shared by the operands and by every copy of a cached decode,
+    and parallel the
+    SH-DSP data transfers executed alongside it, as SHInsn. Text is only
+    rendered when tokens or insn_str is read, so branch analysis and lifting
+    never format a string.
+    """
+    __slots__ = ()
+
+    @property
+    def size(self):
+        return self.opcode["size"]
+
+    @property
+    def memory(self):
+        """MemRef tuples for the memory operands, see AddrMode"""
+        return self.opcode["memory"]
+
+    @property
+    def ea(self):
+        """Resolved address of a @(disp,PC) operand, or None"""
+        return self.fields.ea
+
+    @property
+    def tokens(self):
+        """(InstructionTextTokenType, text) pairs for the listing"""
+        fields = self.fields
+        tokens = [
+            (toke_type, fmt.format(fields) if field is None else names[fields[field]])
+            for toke_type, fmt, field, names in self.opcode["listing"]
+        ]
+        for part in self.parallel:
+            # nopx and friends already end in a space
+            if tokens[-1][1] != ' ':
+                tokens.append((InstructionTextTokenType.TextToken, ' '))
+            tokens.extend(part.tokens)
+        return tokens
+
+    @property
+    def insn_str(self):
+        return "".join([text for _, text in self.tokens])
+
+def _decode(opcode, raw_insn, addr):
+    """Extract the fields of raw_insn for opcode and build an SHInsn"""
+    template, steps, sign, label, pcrel, parallel = opcode["fields"]
+
+    values = list(template)
+    for idx, mask, shift in steps:
+        values[idx] |= (raw_insn & mask) >> shift
+    if sign:
+        values[_DISP] = (values[_DISP] ^ sign) - sign
+    if label is not None:
+        scale, offset = label
+        values[_DISP] = (values[_DISP] * scale + addr + offset) & 0xffffffff
+    if pcrel is not None:
+        scale, align = pcrel
+        values[_EA] = ((addr & align) + 4 + values[_DISP] * scale) & 0xffffffff
+    fields = _make_fields(values)
+
+    operands = tuple([SHOperand(oper, fields) for oper in opcode["args"]])
+
+    if parallel is None:
+        return SHInsn(opcode, raw_insn, addr, fields, operands)
+
+    shift, table = parallel
+    moves = (raw_insn >> shift) & 0x3ff
+    parts = tuple([_decode(part, 0xf000 | moves, addr) for part in table[moves]])
+    return SHInsn(opcode, raw_insn, addr, fields, operands, parts)
+
+def _relocate(insn, addr):
+    """insn, decoded at address 0, moved to addr
+
+    Only label targets and @(disp,PC) addresses depend on the address, those
+    opcodes get new Fields; every other decode shares fields and operands
+    with insn.
+    """
+    layout = insn.opcode["fields"]
+    label = layout.label
+    pcrel = layout.pcrel
+    fields = insn.fields
+    operands = insn.operands
+    if label is not None or pcrel is not None:
+        values = list(fields)
+        if label is not None:
+            values[_DISP] = (values[_DISP] + addr) & 0xffffffff
+        if pcrel is not None:
+            values[_EA] = (values[_EA] + (addr & pcrel[1])) & 0xffffffff
+        fields = _make_fields(values)
+        operands = tuple([SHOperand(operand.oper, fields) for operand in operands])
+
+    parts = insn.parallel
+    if parts:
+        parts = tuple([_relocate(part, addr) for part in parts])
+    return SHInsn(insn.opcode, insn.raw_insn, addr, fields, operands, parts)
+
+_ID_BITS = len(OPCODES).bit_length()
+_ID_MASK = (1 << _ID_BITS) - 1
+
+CacheStats = namedtuple("CacheStats", ("hits", "misses", "evictions", "size", "maxsize"))
+
+class DecodeCache:
+    """Bounded LRU cache of decodes, a drop-in for _decode
+
+    Entries are keyed by opcode and raw word and hold the instruction
+    decoded at address 0, a hit only relocates it to the requested
+    address (see _relocate()), so common words (nop, rts, push/pop,
+    literal loads) are decoded once. The LRU is functools.lru_cache, safe
+    to share between analysis threads.
+    """
+
+    def __init__(self, maxsize=4096):
+        # A single int key skips lru_cache's key tuple
+        @functools.lru_cache(maxsize=maxsize)
+        def decode_at_zero(key):
+            return _decode(OPCODES[key & _ID_MASK], key >> _ID_BITS, 0)
+
+        self._decode_at_zero = decode_at_zero
+
+    def __call__(self, opcode, raw_insn, addr):
+        insn = self._decode_at_zero((raw_insn << _ID_BITS) | opcode["id"])
+        if addr == 0:
+            return insn
+        return _relocate(insn, addr)
+
+    def stats(self):
+        """CacheStats for the cache since it was created or cleared"""
+        info = self._decode_at_zero.cache_info()
+        # Every miss adds an entry and only evictions drop one
+        return CacheStats(
+            info.hits, info.misses, info.misses - info.currsize, info.currsize, info.maxsize
+        )
+
+    def clear(self):
+        self._decode_at_zero.cache_clear()
+
+
+MemoStats = namedtuple("MemoStats", ("hits", "misses", "slots"))
+
+class DecodeMemo:
+    """The last decode at each address, for callers that decode it repeatedly
+
+    decode(data, addr) is only called when the memo has no entry for addr
+    with the same instruction bytes, so patched or reloaded code is decoded
+    again. Entries live in a fixed, direct-mapped table of slots (a power
+    of two) indexed by halfword address, a new address replaces whatever
+    shared its slot, so memory stays bounded. Slot writes are single list
+    stores and safe from any thread; the hit and miss counts may miss an
+    update when threads race.
+    """
+
+    def __init__(self, decode, slots=1 << 14):
+        self._decode = decode
+        self._mask = slots - 1
+        self._entries = [None] * slots
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, data, addr):
+        slot = (addr >> 1) & self._mask
+        entry = self._entries[slot]
+        if entry is not None and entry[0] == addr and entry[1] == data:
+            self.hits += 1
+            return entry[2]
+
+        self.misses += 1
+        insn = self._decode(data, addr)
+        self._entries[slot] = (addr, bytes(data), insn)
+        return insn
+
+    def stats(self):
+        return MemoStats(self.hits, self.misses, len(self._entries))
+
+    def clear(self):
+        self._entries = [None] * len(self._entries)
+        self.hits = 0
+        self.misses = 0
+
+def _reg_file(fmt, count, step=1):
+    return tuple([sys.intern(fmt.format(i * step)) for i in range(count)])
+
+def _names(*names):
+    return tuple([sys.intern(name) for name in names])
+
+# Interned register files, the register lists in superh.py are built from these
+GENERAL_REGS = _reg_file("R{}", 16)
+FLOAT_REGS = _reg_file("FR{}", 16)
+EXTENDED_REGS = _reg_file("XF{}", 16)
+PAIR_REGS = _reg_file("DR{}", 8, 2)
+EXTENDED_PAIR_REGS = _reg_file("XD{}", 8, 2)
+VECTOR_REGS = _reg_file("FV{}", 4, 4)
+
+# Register name of reserved register numbers, encodings that use one are
+# invalid
+RESERVED_REG = sys.intern('?')
+
+# SH-DSP registers by their 4-bit Ds / Dz number, '?' values are reserved
+DSP_REGS = _names(
+    '?', '?', '?', '?', '?', 'A1', '?', 'A0',
+    'X0', 'X1', 'Y0', 'Y1', 'M0', 'A1G', 'M1', 'A0G'
+)
+
+# Operand classes whose register is looked up by field value rather than
+# formatted from it: (field, names)
+REG_CLASSES = {
+    'DR{n}': ('n', PAIR_REGS),
+    'DR{m}': ('m', PAIR_REGS),
+    'XD{n}': ('n', EXTENDED_PAIR_REGS),
+    'XD{m}': ('m', EXTENDED_PAIR_REGS),
+    'FV{n}': ('n', VECTOR_REGS),
+    'FV{m}': ('m', VECTOR_REGS),
+    'Ax': ('A', _names('R4', 'R5')),
+    'Ay': ('A', _names('R6', 'R7')),
+    'As': ('A', _names('R4', 'R5', 'R2', 'R3')),
+    'Dx': ('D', _names('X0', 'X1')),
+    'Dy': ('D', _names('Y0', 'Y1')),
+    'Da': ('D', _names('A0', 'A1')),
+    'Ds': ('D', DSP_REGS),
+    'Dz': ('z', DSP_REGS),
+    'Sx': ('x', _names('X0', 'X1', 'A0', 'A1')),
+    'Sy': ('y', _names('Y0', 'Y1', 'M0', 'M1')),
+    'Se': ('e', _names('X0', 'X1', 'Y0', 'A1')),
+    'Sf': ('f', _names('Y0', 'Y1', 'X0', 'A1')),
+    'Dg': ('g', _names('M0', 'M1', 'A0', 'A1')),
+    'Du': ('u', _names('X0', 'Y0', 'A0', 'A1')),
+}
+
+def _build_reg_names():
+    """Map every OpType.REG template in OPCODES to (field, names)
+
+    names is the tuple of interned register names indexed by the value of
+    field, the FIELD_INDEX of 'n', 'm' or one of the SH-DSP fields (the
+    keys of REG_CLASSES are written with the names). Fixed registers have a
+    field of None and a single interned name. Decoding a register operand
+    is then one tuple index.
+    """
+    counts = dict()
+    for opcode in OPCODES:
+        for oper in opcode["args"]:
+            if oper.type != OpType.REG or oper.fmt_str in REG_CLASSES:
+                continue
+            fmt = oper.fmt_str
+            field = 'n' if '{n}' in fmt else 'm' if '{m}' in fmt else None
+            count = 0
+            if field is not None:
+                mask, shift = opcode[field]
+                count = (mask >> shift) + 1
+            counts[fmt] = (field, max(count, counts.get(fmt, (None, 0))[1]))
+
+    names = {
+        fmt: (FIELD_INDEX[field], regs) for fmt, (field, regs) in REG_CLASSES.items()
+    }
+    for fmt, (field, count) in counts.items():
+        if field is None:
+            names[fmt] = (None, sys.intern(fmt))
         else:
-            self.args['imm'] = None
-        if self.opcode['disp'] != 0:
-            if self.opcode["is_label"]:
-                self.args['disp'] = self.raw_insn & self.opcode['disp']
-                self.args['disp'] = (self.args['disp'] * 2) + self.addr  + 4
+            names[fmt] = (FIELD_INDEX[field], tuple([
+                sys.intern(fmt.format_map({field: i})) for i in range(count)
+            ]))
+    return names
+
+REG_NAMES = _build_reg_names()
+
+class AddrMode(Enum):
+    REG=1           # @Rn
+    POST_INC=2      # @Rn+
+    PRE_DEC=3       # @-Rn
+    DISP_REG=4      # @(disp,Rn)
+    R0_REG=5        # @(R0,Rn)
+    DISP_GBR=6      # @(disp,GBR)
+    R0_GBR=7        # @(R0,GBR)
+    DISP_PC=8       # @(disp,PC)
+    DISP_TBR=9      # @@(disp,TBR)
+    POST_INDEX=10   # @Rn+Ri, SH-DSP @Ax+Ix
+
+class MemRef(namedtuple("MemRef", ("kind", "arg", "count", "base", "index", "disp", "scale", "step"))):
+    """A memory operand of an opcode, classified once when the table loads
+
+    arg is the index of its first entry in opcode["args"] and count how many
+    entries it spans. base, index and disp are indices into the operands
+    for the base register, index register (R0 or the SH-DSP index) and
+    displacement, None where the mode has none. scale is the displacement
+    scale in bytes and step the amount @Rn+ / @-Rn move by.
+    """
+    __slots__ = ()
+
+def _compile_memory(opcode):
+    """Classify the memory operands of opcode into MemRef tuples"""
+    args = opcode["args"]
+    scale = opcode["disp"][1]
+    refs = list()
+
+    idx = 0
+    while idx < len(args):
+        oper = args[idx]
+        nxt = args[idx + 1] if idx + 1 < len(args) else None
+
+        if not oper.is_ref:
+            pass
+        elif oper.type == OpType.DISP and nxt is not None and nxt.type == OpType.REG:
+            kind = {
+                'GBR': AddrMode.DISP_GBR,
+                'PC': AddrMode.DISP_PC,
+                'TBR': AddrMode.DISP_TBR,
+            }.get(nxt.fmt_str, AddrMode.DISP_REG)
+            refs.append(MemRef(kind, idx, 2, idx + 1, None, idx, scale, 0))
+            idx += 2
+            continue
+        elif oper.type == OpType.REG and oper.is_pair and oper.fmt_str == 'R0':
+            kind = AddrMode.R0_GBR if nxt.fmt_str == 'GBR' else AddrMode.R0_REG
+            refs.append(MemRef(kind, idx, 2, idx + 1, idx, None, 1, 0))
+            idx += 2
+            continue
+        elif oper.type == OpType.REG and oper.is_pair:
+            refs.append(MemRef(AddrMode.POST_INDEX, idx, 2, idx, idx + 1, None, 1, 0))
+            idx += 2
+            continue
+        elif oper.type == OpType.REG:
+            if oper.mod_reg > 0:
+                kind = AddrMode.POST_INC
+            elif oper.mod_reg < 0:
+                kind = AddrMode.PRE_DEC
             else:
-                self.args['disp'] = self.raw_insn & self.opcode['disp']
+                kind = AddrMode.REG
+            refs.append(MemRef(kind, idx, 1, idx, None, None, 1, abs(oper.mod_reg)))
 
-        else:
-            self.args['disp'] = None
+        idx += 1
 
-def _disasm_sized(raw_insn, addr, size):
-    fmt = "<H"
-    if size == 4:
-        fmt = "<I"
+    return tuple(refs)
 
-    insn_int = struct.unpack(fmt, raw_insn[:size])[0]
+def _compile_reserved(opcode):
+    """(field, names) of the register operands that can pick RESERVED_REG"""
+    reserved = list()
+    for oper in opcode["args"]:
+        if oper.type != OpType.REG:
+            continue
+        field, names = REG_NAMES[oper.fmt_str]
+        if field is not None and RESERVED_REG in names:
+            reserved.append((field, names))
+    return tuple(reserved)
 
-    for opcode in OPCODES:
-        if opcode["size"] != size:
+def has_reserved_regs(opcode, word):
+    """True if word, matched as opcode, names a reserved register
+
+    Those words are not valid encodings of opcode. The decoder tables leave
+    them out when they are built, so decoding never checks this.
+    """
+    steps = opcode["fields"].steps
+    for field, names in opcode["reserved"]:
+        value = 0
+        for idx, mask, shift in steps:
+            if idx == field:
+                value |= (word & mask) >> shift
+        if names[value] is RESERVED_REG:
+            return True
+    return False
+
+# Compiled once at load so decoding never re-checks which fields an opcode has.
+# This and the lookup tables below are the only writes to shared state (the
+# per-variant tables are added once under a lock, DecodeCache locks inside
+# lru_cache): after import the decode path only reads them and the Fields of
+# an SHInsn are immutable, so Binary Ninja's analysis threads can decode
+# concurrently without locks, also on free-threaded builds.
+for _opcode in OPCODES:
+    _opcode["fields"] = _compile_fields(_opcode)
+    _opcode["listing"] = _compile_listing(_opcode)
+    _opcode["memory"] = _compile_memory(_opcode)
+    _opcode["reserved"] = _compile_reserved(_opcode)
+
+# OPCODES in canonical decode priority for each FPU mode, see
+# overlap.priority_order(). PRIORITY is the reset state (SZ=0, PR=0).
+PRIORITY_BY_MODE = tuple(
+    tuple(OPCODES[idx] for idx in priority_order(OPCODES, mode))
+    for mode in FPU_MODES
+)
+PRIORITY = PRIORITY_BY_MODE[0]
+
+def _fill_moves():
+    """Fill _MOVES_Y and _MOVES_XY with the first matching transfers in PRIORITY"""
+    def first(opcodes, word):
+        for opcode in opcodes:
+            instbits, instmask = opcode['opmask']
+            if word & instmask == instbits:
+                return opcode
+        return None
+
+    moves_x = [opcode for opcode in PRIORITY if opcode["id"] in _PARALLEL_X]
+    moves_y = [opcode for opcode in PRIORITY if opcode["id"] in _PARALLEL_Y]
+    for moves in range(0x400):
+        x = first(moves_x, 0xf000 | moves)
+        y = first(moves_y, 0xf000 | moves)
+        y_part = () if y is None or not y["args"] else (y,)
+        _MOVES_Y[moves] = y_part
+        _MOVES_XY[moves] = y_part if x is None or not x["args"] else (x,)
+
+_fill_moves()
+
+def _build_decode16(priority=PRIORITY):
+    """Map every 16-bit word to the first matching opcode in priority (or None)
+
+    Only the free bits of each mask are enumerated, so building the table
+    costs one store per encoding rather than 65536 * len(OPCODES) tests.
+    Words naming a reserved register are left to the next opcode.
+    """
+    table = [None] * 0x10000
+
+    for opcode in priority:
+        if opcode["size"] != 2:
             continue
 
         instbits, instmask = opcode['opmask']
-        if insn_int & instmask == instbits:
-            insn_obj = SHInsn(opcode, insn_int, addr)
-            if not insn_obj.parse_it():
+        for word in encodings(instbits, instmask, 0xffff):
+            if table[word] is None and not has_reserved_regs(opcode, word):
+                table[word] = opcode
+
+    return table
+
+# PREFIX32 entry for the first halfword of an SH-DSP ALU operation
+PARALLEL = object()
+
+def _build_prefix32(priority=PRIORITY):
+    """Map each first halfword to the 32-bit opcodes it can start (or None)
+
+    Candidates are kept in priority order. 32-bit opmasks hold the first
+    fetched halfword in the high bits, so the index is keyed on the top
+    16 bits of each mask. Halfwords that only start SH-DSP ALU operations
+    map to PARALLEL, those are looked up by the second halfword instead,
+    see _build_alu16().
+    """
+    table = [None] * 0x10000
+
+    for opcode in priority:
+        if opcode["size"] != 4:
+            continue
+
+        instbits, instmask = opcode['opmask']
+        for first in encodings(instbits >> 16, instmask >> 16, 0xffff):
+            if table[first] is None:
+                table[first] = list()
+            table[first].append(opcode)
+
+    for first, cands in enumerate(table):
+        if cands is not None and all(opcode["id"] in _PARALLEL_ALU for opcode in cands):
+            table[first] = PARALLEL
+    return [tuple(cands) if isinstance(cands, list) else cands for cands in table]
+
+def _build_alu16(priority=PRIORITY):
+    """Map every second halfword to the first matching SH-DSP ALU operation
+
+    Their first halfwords only differ in the X/Y transfer bits, so the
+    second halfword alone picks the operation rather than a scan over
+    every candidate. None when priority has no ALU operations.
+    """
+    alu = [opcode for opcode in priority if opcode["id"] in _PARALLEL_ALU]
+    if not alu:
+        return None
+
+    table = [None] * 0x10000
+    for opcode in alu:
+        instbits, instmask = opcode['opmask']
+        for second in encodings(instbits & 0xffff, instmask & 0xffff, 0xffff):
+            if table[second] is None \
+                    and not has_reserved_regs(opcode, (instbits & 0xffff0000) | second):
+                table[second] = opcode
+    return table
+
+# (DECODE16, PREFIX32, ALU16) for each FPU mode. The mode only reorders
+# overlapping FPU encodings, so every mode accepts the same words.
+DECODERS = tuple(
+    (_build_decode16(priority), _build_prefix32(priority), _build_alu16(priority))
+    for priority in PRIORITY_BY_MODE
+)
+DECODE16, PREFIX32, ALU16 = DECODERS[0]
+
+# FPSCR bits that select the FPU mode
+FPSCR_PR = 1 << 19
+FPSCR_SZ = 1 << 20
+
+def fpu_mode(fpscr):
+    """FPU mode number (an index into DECODERS) for an FPSCR value"""
+    return (MODE_PR if fpscr & FPSCR_PR else 0) | (MODE_SZ if fpscr & FPSCR_SZ else 0)
+
+# ISA variants opcode["isa"] lists
+VARIANTS = ("SH1", "SH2", "SH2A", "SH3", "SH4", "SH4A", "DSP")
+
+_variant_decoders = dict()
+_variant_lock = threading.Lock()
+
+def _build_variant(variant):
+    """DECODERS built from the opcodes tagged with variant only"""
+    built = dict()
+    decoders = list()
+    for priority in PRIORITY_BY_MODE:
+        priority = tuple(opcode for opcode in priority if variant in opcode["isa"])
+        # Variants without pair FPU forms get the same order in every mode,
+        # so they build one set of tables for all of them
+        key = tuple(opcode["id"] for opcode in priority)
+        if key not in built:
+            built[key] = (
+                _build_decode16(priority), _build_prefix32(priority), _build_alu16(priority)
+            )
+        decoders.append(built[key])
+    return tuple(decoders)
+
+def variant_decoders(variant=None):
+    """DECODERS for one ISA variant, so only its own opcodes can match
+
+    The tables are built on first use and shared afterwards, None gives
+    the full tables.
+    """
+    if variant is None:
+        return DECODERS
+    decoders = _variant_decoders.get(variant)
+    if decoders is None:
+        if variant not in VARIANTS:
+            raise ValueError(f"unknown ISA variant {variant!r}")
+        with _variant_lock:
+            decoders = _variant_decoders.get(variant)
+            if decoders is None:
+                decoders = _build_variant(variant)
+                _variant_decoders[variant] = decoders
+    return decoders
+
+def _build_valid16():
+    """Pack the halfwords that can start an instruction into a 64 Kbit bitmap"""
+    bitmap = bytearray(0x2000)
+    for word in range(0x10000):
+        if DECODE16[word] is not None or PREFIX32[word] is not None:
+            bitmap[word >> 3] |= 1 << (word & 7)
+    return bytes(bitmap)
+
+VALID16 = _build_valid16()
+
+def is_valid(word):
+    """True if the halfword word can start an instruction
+
+    That is either a complete 16-bit instruction or the first halfword of
+    a 32-bit one, whose second halfword may still fail to match.
+    """
+    return (VALID16[word >> 3] >> (word & 7)) & 1 == 1
+
+def _make_decoder(byteorder):
+    """disasm_single and disasm_range for one byte order ("<" or ">")
+
+    SuperH fetches instructions as halfwords, the first one of a 32-bit
+    instruction at the lower address, so only the halfword format depends
+    on the byte order. It is bound here, when the pair is built, and no
+    decode call ever checks it.
+    """
+    # Halfwords are read in place with unpack_from, never by slicing the input
+    unpack = struct.Struct(byteorder + "H").unpack_from
+
+    def disasm_single(raw_insn, addr, mode=0, decoders=DECODERS, decode=_decode):
+        if len(raw_insn) < 2:
+            return None
+
+        decode16, prefix32, alu16 = decoders[mode]
+        first, = unpack(raw_insn, 0)
+
+        # A valid 16-bit encoding always wins, halfwords that cannot start a
+        # 32-bit instruction never look at the second halfword
+        opcode = decode16[first]
+        if opcode is not None:
+            return decode(opcode, first, addr)
+
+        candidates = prefix32[first]
+        if candidates is None or len(raw_insn) < 4:
+            return None
+
+        second, = unpack(raw_insn, 2)
+        insn_int = (first << 16) | second
+        if candidates is PARALLEL:
+            opcode = alu16[second]
+            if opcode is None:
                 return None
-            return insn_obj
+            return decode(opcode, insn_int, addr)
 
-    return None
+        for opcode in candidates:
+            instbits, instmask = opcode['opmask']
+            if insn_int & instmask == instbits:
+                return decode(opcode, insn_int, addr)
+
+        return None
+
+    def disasm_range(buffer, base_addr, start=0, end=None, mode=0, decoders=DECODERS,
+                     decode=_decode):
+        """Linear sweep over buffer[start:end], yielding an SHInsn per instruction
+
+        buffer is anything exposing the buffer protocol (bytes, bytearray,
+        memoryview, mmap) and base_addr is the address of buffer[0]. Halfwords
+        are read in place, nothing is sliced or copied. Undecodable halfwords
+        are skipped, so gaps show up as jumps in insn.addr. mode is the FPU
+        mode the whole range is decoded in, see fpu_mode(), decoders the
+        tables of an ISA variant, see variant_decoders(), and decode builds
+        the SHInsn (a DecodeCache to reuse decodes).
+        """
+        decode16, prefix32, alu16 = decoders[mode]
+
+        with memoryview(buffer) as raw, raw.cast("B") as view:
+            end = len(view) if end is None else min(end, len(view))
+
+            off = start
+            while off + 2 <= end:
+                first, = unpack(view, off)
+
+                opcode = decode16[first]
+                if opcode is not None:
+                    yield decode(opcode, first, base_addr + off)
+                    off += 2
+                    continue
+
+                candidates = prefix32[first]
+                if candidates is PARALLEL and off + 4 <= end:
+                    second, = unpack(view, off + 2)
+                    opcode = alu16[second]
+                    if opcode is not None:
+                        yield decode(opcode, (first << 16) | second, base_addr + off)
+                        off += 4
+                    else:
+                        off += 2
+                    continue
+
+                if candidates is not None and off + 4 <= end:
+                    insn_int = (first << 16) | unpack(view, off + 2)[0]
+                    for opcode in candidates:
+                        instbits, instmask = opcode['opmask']
+                        if insn_int & instmask == instbits:
+                            yield decode(opcode, insn_int, base_addr + off)
+                            off += 4
+                            break
+                    else:
+                        off += 2
+                    continue
 
-def disasm_single(raw_insn, addr):
-    buf_len = len(raw_insn)
-    # if buf_len > 2:
-    #     ret = _disasm_sized(raw_insn, addr, 4)
-    #     if ret is not None:
-    #         return ret
+                off += 2
 
-    if buf_len > 0:
-        ret = _disasm_sized(raw_insn, addr, 2)
-        if ret is not None:
-            return ret
+    return disasm_single, disasm_range
 
-    return None
\ No newline at end of file
+disasm_single, disasm_range = _make_decoder("<")
+disasm_single_be, disasm_range_be = _make_decoder(">")
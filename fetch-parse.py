@@ -1,4 +1,6 @@
+import json
 import os
+import re
 import sys
 
 from lxml import html
@@ -23,12 +25,10 @@ def fetch():
         bit_pat = bit_pat.replace(" ", "")
         insn_text = insn_text.replace("\t\t", " ").replace("\t", " ")
 
-        # TODO: resolve duplex instructions
-        #  eg: padd-pmuls and psub-pmuls
-        if "\n" in insn_text:
-            continue
-
-        insn_text = ' '.join(insn_text.split())
+        # Duplex instructions (padd/pmuls, psub/pmuls) list one operation
+        # per line, the line break is kept for parse()
+        lines = [' '.join(line.split()) for line in insn_text.split("\n")]
+        insn_text = '\n'.join(line for line in lines if line)
         data.append( (insn_text, bit_pat, is_delay) )
 
     return data
@@ -40,14 +40,9 @@ class OpType(Enum):
     DISP=3
     UNKNOWN=5
 
-class Oper:
-    def __init__(self, otype, fmt_str, is_ref, is_pair, mod_reg, size):
-        self.type = otype
-        self.fmt_str = fmt_str
-        self.is_ref = is_ref
-        self.is_pair = is_pair
-        self.mod_reg = mod_reg
-        self.size = size
+# Read-only: decoding shares one Oper per operand between all threads
+class Oper(namedtuple("Oper", ("type", "fmt_str", "is_ref", "is_pair", "mod_reg", "size"))):
+    __slots__ = ()
 
 """
 
@@ -77,18 +72,184 @@ replace_regs = [
     "PC",
     "FPSCR",
     "FPUL",
+    "FR0",
+    "XMTRX",
 ]
 
+# Register classes indexed by a field, the decoder resolves the names
+# through disasm.REG_CLASSES
+class_regs = {
+    "DRn": "DR{n}",
+    "DRm": "DR{m}",
+    "XDn": "XD{n}",
+    "XDm": "XD{m}",
+    "FVn": "FV{n}",
+    "FVm": "FV{m}",
+    "Ax": "Ax",
+    "Ay": "Ay",
+    "As": "As",
+    "Dx": "Dx",
+    "Dy": "Dy",
+    "Da": "Da",
+    "Ds": "Ds",
+    "Dz": "Dz",
+    "Sx": "Sx",
+    "Sy": "Sy",
+    "Se": "Se",
+    "Sf": "Sf",
+    "Dg": "Dg",
+    "Du": "Du",
+}
+
+# SH-DSP post-increment by index register, Ix and Is are R8 and Iy is R9
+index_regs = {
+    "Ax+Ix": ("Ax", "R8"),
+    "Ay+Iy": ("Ay", "R9"),
+    "As+Is": ("As", "R8"),
+    "As+Ix": ("As", "R8"),
+}
+
+# Bit pattern letters of the SH-DSP operand fields
+dsp_fields = "ADxyzefgu"
+
+# ISA variants in the order their tags are emitted
+variants = ["SH1", "SH2", "SH2A", "SH3", "SH4", "SH4A", "DSP"]
+
+# Variants that have the instructions introduced by a generation. FPU is the
+# floating point unit shared by SH-2A and SH-4.
+isa_lines = {
+    "SH1": variants,
+    "SH2": ["SH2", "SH2A", "SH3", "SH4", "SH4A", "DSP"],
+    "SH2A": ["SH2A"],
+    "SH3": ["SH3", "SH4", "SH4A"],
+    "SH4": ["SH4", "SH4A"],
+    "SH4A": ["SH4A"],
+    "DSP": ["DSP"],
+    "FPU": ["SH2A", "SH4", "SH4A"],
+}
+
+# Generation(s) that introduced a mnemonic, anything not found here, in
+# isa_forms or through isa_regs is SH-1 (or SH-2A for 32-bit encodings and
+# FPU for the other f* instructions)
+isa_cmds = {
+    "bf/s": "SH2", "bt/s": "SH2", "braf": "SH2", "bsrf": "SH2", "dt": "SH2",
+    "dmuls.l": "SH2", "dmulu.l": "SH2", "mac.l": "SH2", "mul.l": "SH2",
+    "movrt": "SH2A", "nott": "SH2A", "movml.l": "SH2A", "movmu.l": "SH2A",
+    "bclr": "SH2A", "bld": "SH2A", "bset": "SH2A", "bst": "SH2A",
+    "clips.b": "SH2A", "clips.w": "SH2A", "clipu.b": "SH2A", "clipu.w": "SH2A",
+    "divs": "SH2A", "divu": "SH2A", "mulr": "SH2A",
+    "jsr/n": "SH2A", "rts/n": "SH2A", "rtv/n": "SH2A",
+    "ldbank": "SH2A", "stbank": "SH2A", "resbank": "SH2A",
+    "clrs": "SH3", "sets": "SH3", "ldtlb": "SH3", "pref": "SH3",
+    "shad": ("SH3", "SH2A"), "shld": ("SH3", "SH2A"),
+    "movca.l": "SH4", "ocbi": "SH4", "ocbp": "SH4", "ocbwb": "SH4",
+    "frchg": "SH4", "fipr": "SH4", "ftrv": "SH4",
+    "movli.l": "SH4A", "movco.l": "SH4A", "movua.l": "SH4A", "icbi": "SH4A",
+    "prefi": "SH4A", "synco": "SH4A", "fsca": "SH4A", "fsrra": "SH4A",
+    "fpchg": "SH4A",
+    "nopx": "DSP", "nopy": "DSP", "setrc": "DSP", "ldre": "DSP", "ldrs": "DSP",
+    "movx.w": "DSP", "movy.w": "DSP", "movs.w": "DSP", "movs.l": "DSP",
+}
+
+# Single forms of older mnemonics
+isa_forms = {
+    "mov.b @-Rm,R0": "SH2A", "mov.w @-Rm,R0": "SH2A", "mov.l @-Rm,R0": "SH2A",
+    "mov.b R0,@Rn+": "SH2A", "mov.w R0,@Rn+": "SH2A", "mov.l R0,@Rn+": "SH2A",
+}
+
+# Registers that only exist from some generation on
+isa_regs = {
+    "TBR": "SH2A",
+    "SSR": "SH3", "SPC": "SH3", "Rn_BANK": "SH3", "Rm_BANK": "SH3",
+    "SGR": "SH4", "DBR": "SH4", "XDm": "SH4", "XDn": "SH4",
+    "FPSCR": "FPU", "FPUL": "FPU",
+    "MOD": "DSP", "RE": "DSP", "RS": "DSP", "DSR": "DSP",
+    "A0": "DSP", "X0": "DSP", "X1": "DSP", "Y0": "DSP", "Y1": "DSP",
+}
+
+def isa_variants(cmd, insn_text, bit_pat):
+    """Variants that have an instruction, in the order of variants"""
+    args = re.findall(r"\w+", insn_text[len(cmd):])
+    regs = [isa_regs[arg] for arg in args if arg in isa_regs]
+
+    if insn_text in isa_forms:
+        gens = isa_forms[insn_text]
+    elif cmd in isa_cmds:
+        gens = isa_cmds[cmd]
+    elif regs:
+        gens = regs[0]
+    elif len(bit_pat) == 32:
+        # The SH-DSP parallel instructions live in 1111 10xx, every other
+        # 32-bit encoding is SH-2A
+        gens = "DSP" if bit_pat.startswith("111110") else "SH2A"
+    elif cmd.startswith("f"):
+        gens = "FPU"
+    else:
+        gens = "SH1"
+
+    if isinstance(gens, str):
+        gens = (gens,)
+    have = set(variant for gen in gens for variant in isa_lines[gen])
+    return [variant for variant in variants if variant in have]
+
+# Opcode IDs as [insn_text, bit_pat] pairs in ID order. Anything keyed by
+# opcode["id"] (.shidx files, tables built from it) relies on IDs never
+# moving, so entries new to the source table are appended at the end
+ID_REGISTRY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opcode-ids.json")
+
+def assign_ids(data):
+    """data in opcode ID order, registering entries the registry lacks"""
+    with open(ID_REGISTRY) as fd:
+        registry = [tuple(key) for key in json.load(fd)]
+    ids = {key: opcode_id for opcode_id, key in enumerate(registry)}
+    assert len(ids) == len(registry), f"duplicate entries in {ID_REGISTRY}"
+
+    keys = [(insn_text, bit_pat) for insn_text, bit_pat, _ in data]
+    assert len(set(keys)) == len(keys), "duplicate entries in the source table"
+    missing = set(registry) - set(keys)
+    assert not missing, f"registered opcodes missing from the source table: {sorted(missing)}"
+
+    new = [key for key in keys if key not in ids]
+    if new:
+        for key in new:
+            ids[key] = len(registry)
+            registry.append(key)
+            print(f"New opcode ID {ids[key]}: {key}", file=sys.stderr)
+        with open(ID_REGISTRY, "w") as fd:
+            fd.write("[\n" + ",\n".join("    " + json.dumps(key) for key in registry) + "\n]\n")
+
+    ordered = sorted(data, key=lambda elm: ids[(elm[0], elm[1])])
+    # Registered IDs did not move
+    for opcode_id, (insn_text, bit_pat, _) in enumerate(ordered):
+        assert ids[(insn_text, bit_pat)] == opcode_id, (opcode_id, insn_text)
+    return ordered
+
+def low_bit(field_mask):
+    if field_mask == 0:
+        return 0
+    return (field_mask & -field_mask).bit_length() - 1
+
 def parse(data):
     output = list()
+    output.append("from collections import namedtuple")
     output.append("from enum import Enum")
     output.append("from binaryninja import InstructionTextToken, InstructionTextTokenType\n\n")
     output.append(oper_str)
     output.append("OPCODES = (")
 
-    for elm in data:
+    parallel = {'x': list(), 'y': list(), 'alu': list()}
+
+    # data is in ID order (see assign_ids()), so the position in OPCODES is
+    # the opcode ID and tables keyed by ID are plain lists indexed by it
+    for opcode_id, elm in enumerate(data):
         (insn_text, bit_pat, is_delay) = elm
 
+        # Duplex instructions: the operands of the second operation follow
+        # the first one's, with its mnemonic in between
+        second_text = None
+        if "\n" in insn_text:
+            insn_text, second_text = insn_text.split("\n")
+
         tokens = list()
         if insn_text.startswith("dcf") or insn_text.startswith("dct"):
             cmd = ' '.join(insn_text.split(" ")[0:2])
@@ -108,6 +269,14 @@ def parse(data):
             else:
                 raw_args = [args_text]
 
+        second_cmd = None
+        second_at = len(raw_args)
+        if second_text is not None:
+            second_cmd = second_text.split(" ")[0]
+            raw_args += second_text[len(second_cmd):].lstrip().split(",")
+            insn_text = insn_text + " " + second_text
+            cmd = cmd + " " + second_cmd
+
         oper_width = 0
         if "." in cmd:
             if cmd.endswith(".b"):
@@ -130,6 +299,11 @@ def parse(data):
             is_pair = False
             mod_reg = 0
 
+            if i == second_at and second_cmd is not None:
+                tokens.append("(InstructionTextTokenType.TextToken, ' ')")
+                tokens.append(f"(InstructionTextTokenType.InstructionToken, '{second_cmd}')")
+                tokens.append("(InstructionTextTokenType.TextToken, ' ')")
+
             # Leading addons
             if arg.startswith("@("):
                 arg = arg[2:]
@@ -220,6 +394,23 @@ def parse(data):
                 fmt_str = '0x{imm:x}'
                 op_type = "OpType.IMM"
                 tokens.append(f"(InstructionTextTokenType.IntegerToken, '{fmt_str}')")
+            elif arg in class_regs:
+                op_type = "OpType.REG"
+                fmt_str = class_regs[arg]
+                tokens.append(f"(InstructionTextTokenType.RegisterToken, '{fmt_str}')")
+            elif arg in index_regs:
+                # Emitted as a base/index pair: @R4+R8
+                op_type = "OpType.REG"
+                fmt_str, index_reg = index_regs[arg]
+                is_pair = True
+                tokens.append(f"(InstructionTextTokenType.RegisterToken, '{fmt_str}')")
+                tokens.append("(InstructionTextTokenType.TextToken, '+')")
+                tokens.append(f"(InstructionTextTokenType.RegisterToken, '{index_reg}')")
+                arg_objs.append(f"Oper({op_type}, '{fmt_str}', {is_ref}, {is_pair}, {mod_reg}, {op_size})")
+                op_type = "OpType.REG"
+                fmt_str = index_reg
+                is_ref = False
+                is_pair = False
             elif arg in replace_regs:
                 op_type = "OpType.REG"
                 fmt_str = arg
@@ -231,108 +422,123 @@ def parse(data):
                 tokens.append(f"(InstructionTextTokenType.TextToken, '{fmt_str}')")
 
             tokens.extend(tailing_tokens)
-            if i < (arg_count - 1):
+            if i < (arg_count - 1) and i != second_at - 1:
                 tokens.append("(InstructionTextTokenType.OperandSeparatorToken, ', ')")
 
             arg_objs.append(f"Oper({op_type}, '{fmt_str}', {is_ref}, {is_pair}, {mod_reg}, {op_size})")
 
-        nibbles = [bit_pat[0:4], bit_pat[4:8], bit_pat[8:12], bit_pat[12:16]]
+        # 32-bit instructions keep the first fetched halfword in the high bits
         insn_size = 2
         if len(bit_pat) > 16:
-            nibbles.extend([bit_pat[16:20], bit_pat[20:24], bit_pat[24:28], bit_pat[28:32]])
             insn_size = 4
+        insn_bits = insn_size * 8
+
+        # Masks are built per bit: patterns such as 'nnn0' (DRn) or '0iii'
+        # (#imm3) mix fixed and variable bits inside a single nibble
+        inst = mask = 0
+        fields = {'n': 0, 'm': 0, 'i': 0, 'd': 0}
+        dsp = dict()
+        for pos, b in enumerate(bit_pat):
+            bit = 1 << (insn_bits - 1 - pos)
+            if b in '01':
+                mask |= bit
+                if b == '1':
+                    inst |= bit
+            elif b in fields:
+                fields[b] |= bit
+            elif b in dsp_fields:
+                dsp[b] = dsp.get(b, 0) | bit
+
+        n = fields['n']
+        nshift = low_bit(n)
+        m = fields['m']
+        mshift = low_bit(m)
+        # Split immediates (movi20) are packed low to high by the decoder
+        imm = fields['i']
+        ishift = low_bit(imm)
+        disp = fields['d']
+
+        # Branch labels are signed and count halfwords; @(disp,PC) and
+        # @(disp,Rn) displacements are unsigned and count operand widths,
+        # except for the SH-DSP repeat labels which are signed halfwords
+        disp_scale = 1
+        disp_signed = False
+        if disp == 0:
+            pass
+        elif any(arg.strip() == "label" for arg in raw_args):
+            disp_scale = 2
+            disp_signed = True
+        elif cmd == "mova":
+            disp_scale = 4
+        elif cmd in ("ldrs", "ldre"):
+            disp_scale = 2
+            disp_signed = True
+        elif cmd == "jsr/n":
+            # @@(disp8,TBR) indexes a table of 32-bit function pointers
+            disp_scale = 4
+        elif oper_width != 0:
+            disp_scale = oper_width
+
+        # A few manual entries name Rm in the text but encode the register in
+        # the nnnn bits (lds.l @Rm+,X0) or the other way round (setrc)
+        if m == 0 and n != 0:
+            arg_objs = [arg.replace('{m}', '{n}') for arg in arg_objs]
+            tokens = [token.replace('{m}', '{n}') for token in tokens]
+        elif n == 0 and m != 0:
+            arg_objs = [arg.replace('{n}', '{m}') for arg in arg_objs]
+            tokens = [token.replace('{n}', '{m}') for token in tokens]
+
+        if cmd in ("nopx", "movx.w"):
+            parallel['x'].append(opcode_id)
+        elif cmd in ("nopy", "movy.w"):
+            parallel['y'].append(opcode_id)
+        elif insn_size == 4 and bit_pat.startswith("111110"):
+            parallel['alu'].append(opcode_id)
+
+        dsp_str = ', '.join(
+            f"'{key}': (0x{dsp[key]:x}, 0x{low_bit(dsp[key]):x})" for key in sorted(dsp)
+        )
 
-        inst = mask = ''
-        for b in nibbles:
-            if b[0] in '01':
-                x = 0
-                if b[0] == '1':
-                    x = x + 8
-                if b[1] == '1':
-                    x = x + 4
-                if b[2] == '1':
-                    x = x + 2
-                if b[3] == '1':
-                    x = x + 1
-                inst = inst + hex(x)[2]
-                mask = mask + 'f'
-            else:
-                inst = inst + '0'
-                mask = mask + '0'
-
-        n = nshift = 0
-        if bit_pat[4] == 'n':
-            n |= 0x0f00
-            nshift = 8
-        if bit_pat[8] == 'n':
-            n |= 0x00f0
-            nshift = 4
-
-        m = mshift = 0
-        if bit_pat[4] == 'm':
-            m |= 0x0f00
-            mshift = 8
-        elif bit_pat[8] == 'm':
-            m |= 0x00f0
-            mshift = 4
-
-        imm = ishift = 0
-        if bit_pat[8] == 'i':
-            imm |= 0x00f0
-            ishift = 4
-        if bit_pat[12] == 'i':
-            imm |= 0x000f
-            ishift = 0
-        if bit_pat[13] == "i":
-            imm |= 0x0007
-            ishift = 0
-
-        disp = 0
-        if bit_pat[12] == 'd':
-            disp |= 0x000f
-            if bit_pat[8] == 'd':
-                disp |= 0x00f0
-                if bit_pat[4] == 'd':
-                    disp |= 0x0f00
-
-
-        if insn_size == 4 and bit_pat[16] == 'd':
-            disp |= 0x000f0000
-            if bit_pat[20] == 'd':
-                disp |= 0x00f00000
-                if bit_pat[24] == 'd':
-                    disp |= 0x0f000000
-                    if bit_pat[28] == 'd':
-                        disp |= 0xf0000000
-
-        args_str = ',\n            '.join(arg_objs)
-        token_str = ',\n            '.join(tokens)
+        args_str = ''.join(f"            {arg},\n" for arg in arg_objs)
+        token_str = ''.join(f"            {token},\n" for token in tokens)
 
         fmt = (
             "    {\n"
-            f"        'opmask': (0x{inst}, 0x{mask}),\n"
+            f"        'id': {opcode_id},\n"
+            f"        'opmask': (0x{inst:0{insn_size * 2}x}, 0x{mask:0{insn_size * 2}x}),\n"
             f"        'm': (0x{m:x}, 0x{mshift:x}),\n"
             f"        'n': (0x{n:x}, 0x{nshift:x}),\n"
             f"        'imm': (0x{imm:x}, 0x{ishift:x}),\n"
-            f"        'disp': 0x{disp:x},\n"
+            f"        'disp': (0x{disp:x}, {disp_scale}, {disp_signed}),\n"
+            f"        'dsp': {{{dsp_str}}},\n"
             f"        'cmd': '{cmd}',\n"
             f"        'width': {oper_width},\n"
             f"        'size': {insn_size},\n"
             f"        'is_label': {is_label},\n"
             f"        'is_delay': {is_delay},\n"
-            "        'args': [\n"
-            f"            {args_str}"
-            "\n        ],\n"
-            "        'tokens': [\n"
-            f"            {token_str}"
-            "\n        ],\n"
+            f"        'isa': {tuple(isa_variants(cmd, insn_text, bit_pat))},\n"
+            "        'args': (\n"
+            f"{args_str}"
+            "        ),\n"
+            "        'tokens': (\n"
+            f"{token_str}"
+            "        ),\n"
             "    },"
         )
         output.append(fmt)
 
     output.append(")")
+
+    output.append("")
+    output.append("# SH-DSP parallel instructions: IDs of the X and Y data transfers, which")
+    output.append("# share one 16-bit word, and of the ALU operations, whose 32-bit word")
+    output.append("# carries an X/Y transfer pair in the low 10 bits of the first halfword")
+    output.append("DSP_PARALLEL = {")
+    for part in ('x', 'y', 'alu'):
+        output.append(f"    '{part}': {tuple(parallel[part])},")
+    output.append("}")
     for elm in output:
         print(elm)
 
-data = fetch()
+data = assign_ids(fetch())
 parse(data)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from collections import namedtuple
 from enum import Enum
 from binaryninja import InstructionTextToken, InstructionTextTokenType
 
@@ -9,126 +10,136 @@ class OpType(Enum):
     DISP=3
     UNKNOWN=5
 
-class Oper:
-    def __init__(self, otype, fmt_str, is_ref, is_pair, mod_reg, size):
-        self.type = otype
-        self.fmt_str = fmt_str
-        self.is_ref = is_ref
-        self.is_pair = is_pair
-        self.mod_reg = mod_reg
-        self.size = size
+# Read-only: decoding shares one Oper per operand between all threads
+class Oper(namedtuple("Oper", ("type", "fmt_str", "is_ref", "is_pair", "mod_reg", "size"))):
+    __slots__ = ()
 
 
 OPCODES = (
     {
+        'id': 0,
         'opmask': (0x6003, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 1,
         'opmask': (0xe000, 0xf000),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 2,
         'opmask': (0x00000000, 0xf00f0000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0xf0, 0x4),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0xf0ffff, 0x0),
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movi20',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 3),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movi20'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 3,
         'opmask': (0x00010000, 0xf00f0000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0xf0, 0x4),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0xf0ffff, 0x0),
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movi20s',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 3),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movi20s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 4,
         'opmask': (0xc700, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 4, False),
+        'dsp': {},
         'cmd': 'mova',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'PC', False, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mova'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -137,26 +148,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'PC'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 5,
         'opmask': (0x9000, 0xf000),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'PC', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -165,26 +179,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'PC'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 6,
         'opmask': (0xd000, 0xf000),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 4, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'PC', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -193,464 +210,521 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'PC'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 7,
         'opmask': (0x6000, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 8,
         'opmask': (0x6001, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 9,
         'opmask': (0x6002, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 10,
         'opmask': (0x2000, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 11,
         'opmask': (0x2001, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 12,
         'opmask': (0x2002, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 13,
         'opmask': (0x6004, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 1, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 14,
         'opmask': (0x6005, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 2, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 15,
         'opmask': (0x6006, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 16,
         'opmask': (0x2004, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -1, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -1, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 17,
         'opmask': (0x2005, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -2, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -2, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 18,
         'opmask': (0x2006, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 19,
         'opmask': (0x40cb, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, -1, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@-'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 20,
         'opmask': (0x40db, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, -2, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@-'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 21,
         'opmask': (0x40eb, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, -4, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@-'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 22,
         'opmask': (0x408b, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 1, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 1, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
+        'id': 23,
         'opmask': (0x409b, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 2, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 2, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
+        'id': 24,
         'opmask': (0x40ab, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
+        'id': 25,
         'opmask': (0x8400, 0xff00),
         'm': (0xf0, 0x4),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xf,
+        'disp': (0xf, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -659,26 +733,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 26,
         'opmask': (0x30014000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -687,26 +764,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 27,
         'opmask': (0x30018000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'movu.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movu.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -715,26 +795,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 28,
         'opmask': (0x8500, 0xff00),
         'm': (0xf0, 0x4),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xf,
+        'disp': (0xf, 2, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -743,26 +826,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 29,
         'opmask': (0x30015000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 2, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -771,26 +857,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 30,
         'opmask': (0x30019000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 2, False),
+        'dsp': {},
         'cmd': 'movu.w',
         'width': 2,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movu.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -799,26 +888,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 31,
         'opmask': (0x5000, 0xf000),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0xf,
+        'disp': (0xf, 4, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -827,26 +919,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 32,
         'opmask': (0x30016000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 4, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -855,26 +950,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 33,
         'opmask': (0x8000, 0xff00),
         'm': (0x0, 0x0),
         'n': (0xf0, 0x4),
         'imm': (0x0, 0x0),
-        'disp': 0xf,
+        'disp': (0xf, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
@@ -883,26 +981,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 34,
         'opmask': (0x30010000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
@@ -911,26 +1012,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 35,
         'opmask': (0x8100, 0xff00),
         'm': (0x0, 0x0),
         'n': (0xf0, 0x4),
         'imm': (0x0, 0x0),
-        'disp': 0xf,
+        'disp': (0xf, 2, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
@@ -939,26 +1043,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 36,
         'opmask': (0x30011000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 2, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
@@ -967,26 +1074,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 37,
         'opmask': (0x1000, 0xf000),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0xf,
+        'disp': (0xf, 4, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
@@ -995,26 +1105,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 38,
         'opmask': (0x30012000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 4, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
@@ -1023,26 +1136,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 39,
         'opmask': (0x000c, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R0', True, True, 0, 0),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -1051,26 +1167,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 40,
         'opmask': (0x000d, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R0', True, True, 0, 0),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -1079,26 +1198,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 41,
         'opmask': (0x000e, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R0', True, True, 0, 0),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -1107,26 +1229,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 42,
         'opmask': (0x0004, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
@@ -1135,26 +1260,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 43,
         'opmask': (0x0005, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
@@ -1163,26 +1291,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 44,
         'opmask': (0x0006, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
@@ -1191,26 +1322,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 45,
         'opmask': (0xc400, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'GBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -1219,26 +1353,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'GBR'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 46,
         'opmask': (0xc500, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'GBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -1247,26 +1384,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'GBR'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 47,
         'opmask': (0xc600, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 4, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
             Oper(OpType.REG, 'GBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -1275,26 +1415,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'GBR'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 48,
         'opmask': (0xc000, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 1, False),
+        'dsp': {},
         'cmd': 'mov.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
@@ -1303,26 +1446,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 49,
         'opmask': (0xc100, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, False),
+        'dsp': {},
         'cmd': 'mov.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
@@ -1331,26 +1477,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 50,
         'opmask': (0xc200, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 4, False),
+        'dsp': {},
         'cmd': 'mov.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mov.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
@@ -1359,349 +1508,393 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 51,
         'opmask': (0x0073, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movco.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4A',),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movco.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 52,
         'opmask': (0x0063, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movli.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movli.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 53,
         'opmask': (0x40a9, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movua.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movua.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 54,
         'opmask': (0x40e9, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movua.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movua.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 55,
         'opmask': (0x40f1, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movml.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R15', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R15', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movml.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R15')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R15'),
+        ),
     },
     {
+        'id': 56,
         'opmask': (0x40f5, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movml.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R15', True, False, 4, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movml.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R15'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 57,
         'opmask': (0x40f0, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movmu.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R15', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R15', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movmu.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R15')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R15'),
+        ),
     },
     {
+        'id': 58,
         'opmask': (0x40f4, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movmu.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R15', True, False, 4, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movmu.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R15'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 59,
         'opmask': (0x0039, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movrt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movrt'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 60,
         'opmask': (0x0029, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movt'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 61,
         'opmask': (0x0068, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'nott',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'nott'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 62,
         'opmask': (0x6008, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'swap.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'swap.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 63,
         'opmask': (0x6009, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'swap.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'swap.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 64,
         'opmask': (0x200d, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'xtrct',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'xtrct'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0x30094000, 0xf0fff000),
+        'id': 65,
+        'opmask': (0x30094000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'band.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, False, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'band.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -1709,26 +1902,29 @@ OPCODES = (
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0x3009c000, 0xf0fff000),
+        'id': 66,
+        'opmask': (0x3009c000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bandnot.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bandnot.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -1737,26 +1933,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x30090000, 0xf0fff000),
+        'id': 67,
+        'opmask': (0x30090000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bclr.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bclr.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -1765,49 +1964,55 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x8600, 0xff0f),
+        'id': 68,
+        'opmask': (0x8600, 0xff08),
         'm': (0x0, 0x0),
         'n': (0xf0, 0x4),
         'imm': (0x7, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'bclr',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bclr'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0x30093000, 0xf0fff000),
+        'id': 69,
+        'opmask': (0x30093000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bld.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bld.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -1816,49 +2021,55 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x8708, 0xff0f),
+        'id': 70,
+        'opmask': (0x8708, 0xff08),
         'm': (0x0, 0x0),
         'n': (0xf0, 0x4),
         'imm': (0x7, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'bld',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bld'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0x3009b000, 0xf0fff000),
+        'id': 71,
+        'opmask': (0x3009b000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bldnot.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bldnot.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -1867,26 +2078,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x30095000, 0xf0fff000),
+        'id': 72,
+        'opmask': (0x30095000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bor.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bor.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -1895,26 +2109,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x3009d000, 0xf0fff000),
+        'id': 73,
+        'opmask': (0x3009d000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bornot.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bornot.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -1923,26 +2140,29 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x30091000, 0xf0fff000),
+        'id': 74,
+        'opmask': (0x30091000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bset.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bset.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -1951,49 +2171,55 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x8608, 0xff0f),
+        'id': 75,
+        'opmask': (0x8608, 0xff08),
         'm': (0x0, 0x0),
         'n': (0xf0, 0x4),
         'imm': (0x7, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'bset',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bset'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0x30092000, 0xf0fff000),
+        'id': 76,
+        'opmask': (0x30092000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bst.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bst.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -2002,49 +2228,55 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x8700, 0xff0f),
+        'id': 77,
+        'opmask': (0x8700, 0xff08),
         'm': (0x0, 0x0),
         'n': (0xf0, 0x4),
         'imm': (0x7, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'bst',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bst'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0x30096000, 0xf0fff000),
+        'id': 78,
+        'opmask': (0x30096000, 0xf08ff000),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'n': (0xf000000, 0x18),
+        'imm': (0x700000, 0x14),
+        'disp': (0xfff, 1, False),
+        'dsp': {},
         'cmd': 'bxor.b',
         'width': 1,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bxor.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -2053,667 +2285,756 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 79,
         'opmask': (0x300c, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'add',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'add'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 80,
         'opmask': (0x7000, 0xf000),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'add',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'add'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 81,
         'opmask': (0x300e, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'addc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'addc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 82,
         'opmask': (0x300f, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'addv',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'addv'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 83,
         'opmask': (0x8800, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/eq',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/eq'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 84,
         'opmask': (0x3000, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/eq',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/eq'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 85,
         'opmask': (0x3002, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/hs',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/hs'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 86,
         'opmask': (0x3003, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/ge',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/ge'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 87,
         'opmask': (0x3006, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/hi',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/hi'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 88,
         'opmask': (0x3007, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/gt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/gt'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 89,
         'opmask': (0x4015, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/pl',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/pl'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 90,
         'opmask': (0x4011, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/pz',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/pz'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 91,
         'opmask': (0x200c, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'cmp/str',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'cmp/str'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 92,
         'opmask': (0x4091, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'clips.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'clips.b'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 93,
         'opmask': (0x4095, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'clips.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'clips.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 94,
         'opmask': (0x4081, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'clipu.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'clipu.b'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 95,
         'opmask': (0x4085, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'clipu.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'clipu.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 96,
         'opmask': (0x2007, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'div0s',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'div0s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 97,
         'opmask': (0x0019, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'div0u',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'div0u'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 98,
         'opmask': (0x3004, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'div1',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'div1'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 99,
         'opmask': (0x4094, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'divs',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'divs'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 100,
         'opmask': (0x4084, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'divu',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'divu'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 101,
         'opmask': (0x300d, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'dmuls.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dmuls.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 102,
         'opmask': (0x3005, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'dmulu.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dmulu.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 103,
         'opmask': (0x4010, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'dt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dt'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 104,
         'opmask': (0x600e, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'exts.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'exts.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 105,
         'opmask': (0x600f, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'exts.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'exts.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 106,
         'opmask': (0x600c, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'extu.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'extu.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 107,
         'opmask': (0x600d, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'extu.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'extu.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 108,
         'opmask': (0x000f, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mac.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mac.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
@@ -2722,25 +3043,28 @@ OPCODES = (
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
+        'id': 109,
         'opmask': (0x400f, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mac.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 2, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 2, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 2, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mac.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
@@ -2749,279 +3073,315 @@ OPCODES = (
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
+        'id': 110,
         'opmask': (0x0007, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mul.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mul.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 111,
         'opmask': (0x4080, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mulr',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mulr'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 112,
         'opmask': (0x200f, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'muls.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'muls.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 113,
         'opmask': (0x200e, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'mulu.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'mulu.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 114,
         'opmask': (0x600b, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'neg',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'neg'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 115,
         'opmask': (0x600a, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'negc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'negc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 116,
         'opmask': (0x3008, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sub',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sub'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 117,
         'opmask': (0x300a, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'subc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'subc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 118,
         'opmask': (0x300b, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'subv',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'subv'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 119,
         'opmask': (0x2009, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'and',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'and'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 120,
         'opmask': (0xc900, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'and',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'and'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 121,
         'opmask': (0xcd00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'and.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'and.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -3030,95 +3390,107 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 122,
         'opmask': (0x6007, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'not',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'not'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 123,
         'opmask': (0x200b, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'or',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'or'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 124,
         'opmask': (0xcb00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'or',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'or'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 125,
         'opmask': (0xcf00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'or.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'or.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -3127,93 +3499,105 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 126,
         'opmask': (0x401b, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'tas.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'tas.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 127,
         'opmask': (0x2008, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'tst',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'tst'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 128,
         'opmask': (0xc800, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'tst',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'tst'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 129,
         'opmask': (0xcc00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'tst.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'tst.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -3222,72 +3606,81 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 130,
         'opmask': (0x200a, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'xor',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'xor'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 131,
         'opmask': (0xca00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'xor',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'xor'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 132,
         'opmask': (0xce00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'xor.b',
         'width': 1,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'xor.b'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
@@ -3296,3241 +3689,3660 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 133,
         'opmask': (0x4024, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'rotcl',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'rotcl'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 134,
         'opmask': (0x4025, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'rotcr',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'rotcr'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 135,
         'opmask': (0x4004, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'rotl',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'rotl'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 136,
         'opmask': (0x4005, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'rotr',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'rotr'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 137,
         'opmask': (0x400c, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shad',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shad'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 138,
         'opmask': (0x4020, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shal',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shal'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 139,
         'opmask': (0x4021, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shar',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shar'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 140,
         'opmask': (0x400d, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shld',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shld'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 141,
         'opmask': (0x4000, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shll',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shll'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 142,
         'opmask': (0x4008, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shll2',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shll2'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 143,
         'opmask': (0x4018, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shll8',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shll8'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 144,
         'opmask': (0x4028, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shll16',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shll16'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 145,
         'opmask': (0x4001, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shlr',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shlr'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 146,
         'opmask': (0x4009, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shlr2',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shlr2'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 147,
         'opmask': (0x4019, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shlr8',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shlr8'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 148,
         'opmask': (0x4029, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'shlr16',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'shlr16'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 149,
         'opmask': (0x8b00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, True),
+        'dsp': {},
         'cmd': 'bf',
         'width': 0,
         'size': 2,
         'is_label': True,
         'is_delay': False,
-        'args': [
-            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bf'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}')
-        ],
+            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
+        ),
     },
     {
+        'id': 150,
         'opmask': (0x8f00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, True),
+        'dsp': {},
         'cmd': 'bf/s',
         'width': 0,
         'size': 2,
         'is_label': True,
         'is_delay': True,
-        'args': [
-            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2)
-        ],
-        'tokens': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bf/s'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}')
-        ],
+            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
+        ),
     },
     {
+        'id': 151,
         'opmask': (0x8900, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, True),
+        'dsp': {},
         'cmd': 'bt',
         'width': 0,
         'size': 2,
         'is_label': True,
         'is_delay': False,
-        'args': [
-            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bt'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}')
-        ],
+            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
+        ),
     },
     {
+        'id': 152,
         'opmask': (0x8d00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, True),
+        'dsp': {},
         'cmd': 'bt/s',
         'width': 0,
         'size': 2,
         'is_label': True,
         'is_delay': True,
-        'args': [
-            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2)
-        ],
-        'tokens': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bt/s'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}')
-        ],
+            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
+        ),
     },
     {
+        'id': 153,
         'opmask': (0xa000, 0xf000),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xfff,
+        'disp': (0xfff, 2, True),
+        'dsp': {},
         'cmd': 'bra',
         'width': 0,
         'size': 2,
         'is_label': True,
         'is_delay': True,
-        'args': [
-            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bra'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}')
-        ],
+            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
+        ),
     },
     {
+        'id': 154,
         'opmask': (0x0023, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'braf',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': True,
-        'args': [
-            Oper(OpType.REG, 'R{m}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{m}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'braf'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{m}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+        ),
     },
     {
+        'id': 155,
         'opmask': (0xb000, 0xf000),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xfff,
+        'disp': (0xfff, 2, True),
+        'dsp': {},
         'cmd': 'bsr',
         'width': 0,
         'size': 2,
         'is_label': True,
         'is_delay': True,
-        'args': [
-            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.DISP, '0x{disp:x}', False, False, 0, 2),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bsr'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}')
-        ],
+            (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
+        ),
     },
     {
+        'id': 156,
         'opmask': (0x0003, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'bsrf',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': True,
-        'args': [
-            Oper(OpType.REG, 'R{m}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{m}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'bsrf'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{m}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+        ),
     },
     {
+        'id': 157,
         'opmask': (0x402b, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'jmp',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': True,
-        'args': [
-            Oper(OpType.REG, 'R{m}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{m}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'jmp'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{m}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+        ),
     },
     {
+        'id': 158,
         'opmask': (0x400b, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'jsr',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': True,
-        'args': [
-            Oper(OpType.REG, 'R{m}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.REG, 'R{m}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'jsr'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{m}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+        ),
     },
     {
+        'id': 159,
         'opmask': (0x404b, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'jsr/n',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{m}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+            Oper(OpType.REG, 'R{m}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'jsr/n'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{m}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+        ),
     },
     {
+        'id': 160,
         'opmask': (0x8300, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 4, False),
+        'dsp': {},
         'cmd': 'jsr/n',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'TBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'TBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'jsr/n'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@@('),
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'TBR'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 161,
         'opmask': (0x000b, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'rts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': True,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'rts'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 162,
         'opmask': (0x006b, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'rts/n',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'rts/n'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 163,
         'opmask': (0x007b, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'rtv/n',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{m}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+            Oper(OpType.REG, 'R{m}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'rtv/n'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{m}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+        ),
     },
     {
+        'id': 164,
         'opmask': (0x0028, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'clrmac',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'clrmac'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 165,
         'opmask': (0x0048, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'clrs',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'clrs'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 166,
         'opmask': (0x0008, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'clrt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'clrt'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 167,
         'opmask': (0x00e3, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'icbi',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4A',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'icbi'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 168,
         'opmask': (0x40e5, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldbank',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.REG, 'R0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldbank'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R0'),
+        ),
     },
     {
+        'id': 169,
         'opmask': (0x400e, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'SR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'SR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'SR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'SR'),
+        ),
     },
     {
+        'id': 170,
         'opmask': (0x4007, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'SR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'SR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'SR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'SR'),
+        ),
     },
     {
+        'id': 171,
         'opmask': (0x404a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'TBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'TBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'TBR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'TBR'),
+        ),
     },
     {
+        'id': 172,
         'opmask': (0x401e, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'GBR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'GBR'),
+        ),
     },
     {
+        'id': 173,
         'opmask': (0x4017, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'GBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'GBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'GBR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'GBR'),
+        ),
     },
     {
+        'id': 174,
         'opmask': (0x402e, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'VBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'VBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'VBR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'VBR'),
+        ),
     },
     {
+        'id': 175,
         'opmask': (0x4027, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'VBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'VBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'VBR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'VBR'),
+        ),
     },
     {
+        'id': 176,
         'opmask': (0x405e, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'MOD', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'MOD', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MOD')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MOD'),
+        ),
     },
     {
+        'id': 177,
         'opmask': (0x4057, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'MOD', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'MOD', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MOD')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MOD'),
+        ),
     },
     {
+        'id': 178,
         'opmask': (0x407e, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'RE', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'RE', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'RE')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'RE'),
+        ),
     },
     {
+        'id': 179,
         'opmask': (0x4077, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'RE', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'RE', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'RE')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'RE'),
+        ),
     },
     {
+        'id': 180,
         'opmask': (0x406e, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'RS', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'RS', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'RS')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'RS'),
+        ),
     },
     {
+        'id': 181,
         'opmask': (0x4067, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'RS', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'RS', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'RS')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'RS'),
+        ),
     },
     {
+        'id': 182,
         'opmask': (0x403a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'SGR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'SGR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'SGR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'SGR'),
+        ),
     },
     {
+        'id': 183,
         'opmask': (0x4036, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'SGR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'SGR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'SGR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'SGR'),
+        ),
     },
     {
+        'id': 184,
         'opmask': (0x403e, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'SSR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'SSR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'SSR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'SSR'),
+        ),
     },
     {
+        'id': 185,
         'opmask': (0x4037, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'SSR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'SSR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'SSR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'SSR'),
+        ),
     },
     {
+        'id': 186,
         'opmask': (0x404e, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'SPC', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'SPC', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'SPC')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'SPC'),
+        ),
     },
     {
+        'id': 187,
         'opmask': (0x4047, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'SPC', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'SPC', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'SPC')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'SPC'),
+        ),
     },
     {
+        'id': 188,
         'opmask': (0x40fa, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'DBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'DBR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DBR'),
+        ),
     },
     {
+        'id': 189,
         'opmask': (0x40f6, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'DBR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DBR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'DBR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DBR'),
+        ),
     },
     {
-        'opmask': (0x408e, 0xf0ff),
+        'id': 190,
+        'opmask': (0x408e, 0xf08f),
         'm': (0xf00, 0x8),
-        'n': (0x0, 0x0),
+        'n': (0x70, 0x4),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}_BANK', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}_BANK', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}_BANK')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}_BANK'),
+        ),
     },
     {
-        'opmask': (0x4087, 0xf0ff),
+        'id': 191,
+        'opmask': (0x4087, 0xf08f),
         'm': (0xf00, 0x8),
-        'n': (0x0, 0x0),
+        'n': (0x70, 0x4),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'R{n}_BANK', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}_BANK', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}_BANK')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}_BANK'),
+        ),
     },
     {
+        'id': 192,
         'opmask': (0x8e00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, True),
+        'dsp': {},
         'cmd': 'ldre',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'PC', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'PC', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldre'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'PC'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 193,
         'opmask': (0x8c00, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0xff,
+        'disp': (0xff, 2, True),
+        'dsp': {},
         'cmd': 'ldrs',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 1),
-            Oper(OpType.REG, 'PC', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'PC', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldrs'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'PC'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 194,
         'opmask': (0x400a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'MACH', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'MACH', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACH')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACH'),
+        ),
     },
     {
+        'id': 195,
         'opmask': (0x4006, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'MACH', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'MACH', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACH')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACH'),
+        ),
     },
     {
+        'id': 196,
         'opmask': (0x401a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'MACL', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'MACL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACL'),
+        ),
     },
     {
+        'id': 197,
         'opmask': (0x4016, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'MACL', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'MACL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACL'),
+        ),
     },
     {
+        'id': 198,
         'opmask': (0x402a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'PR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'PR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'PR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'PR'),
+        ),
     },
     {
+        'id': 199,
         'opmask': (0x4026, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'PR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'PR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'PR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'PR'),
+        ),
     },
     {
+        'id': 200,
         'opmask': (0x406a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'DSR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DSR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'DSR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DSR'),
+        ),
     },
     {
+        'id': 201,
         'opmask': (0x4066, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'DSR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DSR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'DSR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DSR'),
+        ),
     },
     {
+        'id': 202,
         'opmask': (0x4076, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'A0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'A0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'A0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'A0'),
+        ),
     },
     {
+        'id': 203,
         'opmask': (0x4076, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'A0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'A0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'A0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'A0'),
+        ),
     },
     {
+        'id': 204,
         'opmask': (0x408a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'X0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'X0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'X0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'X0'),
+        ),
     },
     {
+        'id': 205,
         'opmask': (0x4086, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'X0', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 4, 0),
+            Oper(OpType.REG, 'X0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'X0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'X0'),
+        ),
     },
     {
+        'id': 206,
         'opmask': (0x409a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'X1', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'X1', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'X1')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'X1'),
+        ),
     },
     {
+        'id': 207,
         'opmask': (0x4096, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'X1', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 4, 0),
+            Oper(OpType.REG, 'X1', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'X1')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'X1'),
+        ),
     },
     {
+        'id': 208,
         'opmask': (0x40aa, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'Y0', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Y0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'Y0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Y0'),
+        ),
     },
     {
+        'id': 209,
         'opmask': (0x40a6, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'Y0', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 4, 0),
+            Oper(OpType.REG, 'Y0', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'Y0')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Y0'),
+        ),
     },
     {
+        'id': 210,
         'opmask': (0x40ba, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'Y1', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Y1', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'Y1')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Y1'),
+        ),
     },
     {
+        'id': 211,
         'opmask': (0x40b6, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'Y1', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 4, 0),
+            Oper(OpType.REG, 'Y1', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'Y1')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Y1'),
+        ),
     },
     {
+        'id': 212,
         'opmask': (0x0038, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ldtlb',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ldtlb'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 213,
         'opmask': (0x00c3, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'movca.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movca.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 214,
         'opmask': (0x0009, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'nop',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'nop'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 215,
         'opmask': (0x0093, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ocbi',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ocbi'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 216,
         'opmask': (0x00a3, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ocbp',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ocbp'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 217,
         'opmask': (0x00b3, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ocbwb',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ocbwb'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 218,
         'opmask': (0x0083, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'pref',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pref'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 219,
         'opmask': (0x00d3, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'prefi',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4A',),
+        'args': (
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'prefi'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 220,
         'opmask': (0x005b, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'resbank',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH2A',),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'resbank'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 221,
         'opmask': (0x002b, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'rte',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': True,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'rte'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 222,
         'opmask': (0x4014, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'setrc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'R{m}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'setrc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{m}'),
+        ),
     },
     {
+        'id': 223,
         'opmask': (0x8200, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'setrc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'setrc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.IntegerToken, '0x{imm:x}')
-        ],
+            (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
+        ),
     },
     {
+        'id': 224,
         'opmask': (0x0058, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sets',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sets'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 225,
         'opmask': (0x0018, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sett',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sett'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 226,
         'opmask': (0x001b, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sleep',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sleep'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 227,
         'opmask': (0x40e1, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stbank',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'R0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stbank'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 228,
         'opmask': (0x0002, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'SR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'SR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 229,
         'opmask': (0x4003, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'SR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'SR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 230,
         'opmask': (0x004a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'TBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'TBR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 231,
         'opmask': (0x0012, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'GBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 232,
         'opmask': (0x4013, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'GBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'GBR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 233,
         'opmask': (0x0022, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'VBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'VBR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 234,
         'opmask': (0x4023, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'VBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'VBR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 235,
         'opmask': (0x0052, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'MOD', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MOD'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 236,
         'opmask': (0x4053, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'MOD', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MOD'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 237,
         'opmask': (0x0072, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'RE', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'RE'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 238,
         'opmask': (0x4073, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'RE', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'RE'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 239,
         'opmask': (0x0062, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'RS', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'RS'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 240,
         'opmask': (0x4063, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'RS', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'RS'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 241,
         'opmask': (0x003a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'SGR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'SGR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 242,
         'opmask': (0x4032, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'SGR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'SGR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 243,
         'opmask': (0x0032, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'SSR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'SSR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 244,
         'opmask': (0x4033, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'SSR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'SSR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 245,
         'opmask': (0x0042, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'SPC', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'SPC'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 246,
         'opmask': (0x4043, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'SPC', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'SPC'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 247,
         'opmask': (0x00fa, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'DBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'DBR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 248,
         'opmask': (0x40f2, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'DBR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'DBR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0x0082, 0xf0ff),
-        'm': (0x0, 0x0),
+        'id': 249,
+        'opmask': (0x0082, 0xf08f),
+        'm': (0x70, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}_BANK', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}_BANK'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0x4083, 0xf0ff),
-        'm': (0x0, 0x0),
+        'id': 250,
+        'opmask': (0x4083, 0xf08f),
+        'm': (0x70, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'stc.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH3', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}_BANK', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'stc.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}_BANK'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 251,
         'opmask': (0x000a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'MACH', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACH'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 252,
         'opmask': (0x4002, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'MACH', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACH'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 253,
         'opmask': (0x001a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'MACL', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 254,
         'opmask': (0x4012, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'MACL', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 255,
         'opmask': (0x002a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'PR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'PR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 256,
         'opmask': (0x4022, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
             Oper(OpType.REG, 'PR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'PR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 257,
         'opmask': (0x006a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'DSR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'DSR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 258,
         'opmask': (0x4062, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'DSR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'DSR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 259,
         'opmask': (0x007a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'A0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'A0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 260,
         'opmask': (0x4062, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'A0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'A0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 261,
         'opmask': (0x008a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'X0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'X0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 262,
         'opmask': (0x4082, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'X0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'X0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 263,
         'opmask': (0x009a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'X1', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'X1'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 264,
         'opmask': (0x4092, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'X1', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'X1'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 265,
         'opmask': (0x00aa, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'Y0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'Y0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 266,
         'opmask': (0x40a2, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'Y0', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'Y0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 267,
         'opmask': (0x00ba, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'Y1', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'Y1'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 268,
         'opmask': (0x40b2, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'Y1', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'Y1'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 269,
         'opmask': (0x00ab, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'synco',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH4A',),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'synco'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 270,
         'opmask': (0xc300, 0xff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0xff, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'trapa',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1)
-        ],
-        'tokens': [
+        'isa': ('SH1', 'SH2', 'SH2A', 'SH3', 'SH4', 'SH4A', 'DSP'),
+        'args': (
+            Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'trapa'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.IntegerToken, '0x{imm:x}')
-        ],
+            (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
+        ),
     },
     {
+        'id': 271,
         'opmask': (0xf00c, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 272,
         'opmask': (0xf008, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.s',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 273,
         'opmask': (0xf00a, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.s',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 274,
         'opmask': (0xf009, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.s',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 275,
         'opmask': (0xf00b, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.s',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 276,
         'opmask': (0xf006, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.s',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R0', True, True, 0, 0),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -6539,26 +7351,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 277,
         'opmask': (0xf007, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.s',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
@@ -6567,26 +7382,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 278,
         'opmask': (0x30017000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 4, False),
+        'dsp': {},
         'cmd': 'fmov.s',
         'width': 4,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -6595,26 +7413,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 279,
         'opmask': (0x30013000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'm': (0xf00000, 0x14),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 4, False),
+        'dsp': {},
         'cmd': 'fmov.s',
         'width': 4,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.s'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
@@ -6623,312 +7444,351 @@ OPCODES = (
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0xf00c, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 280,
+        'opmask': (0xf00c, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf00c, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 281,
+        'opmask': (0xf10c, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'XDn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'XD{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'XDn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'XD{n}'),
+        ),
     },
     {
-        'opmask': (0xf00c, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 282,
+        'opmask': (0xf01c, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'XDm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'XD{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'XDm'),
+            (InstructionTextTokenType.RegisterToken, 'XD{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf00c, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 283,
+        'opmask': (0xf11c, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'XDm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'XDn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'XD{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'XD{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'XDm'),
+            (InstructionTextTokenType.RegisterToken, 'XD{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'XDn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'XD{n}'),
+        ),
     },
     {
-        'opmask': (0xf008, 0xf00f),
+        'id': 284,
+        'opmask': (0xf008, 0xf10f),
         'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf008, 0xf00f),
+        'id': 285,
+        'opmask': (0xf108, 0xf10f),
         'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'XDn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'XD{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'XDn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'XD{n}'),
+        ),
     },
     {
-        'opmask': (0xf00a, 0xf00f),
-        'm': (0xf0, 0x4),
+        'id': 286,
+        'opmask': (0xf00a, 0xf01f),
+        'm': (0xe0, 0x5),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0xf00a, 0xf00f),
-        'm': (0xf0, 0x4),
+        'id': 287,
+        'opmask': (0xf01a, 0xf01f),
+        'm': (0xe0, 0x5),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'XDm', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'XD{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'R{n}', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'XDm'),
+            (InstructionTextTokenType.RegisterToken, 'XD{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0xf009, 0xf00f),
+        'id': 288,
+        'opmask': (0xf009, 0xf10f),
         'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 8, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf009, 0xf00f),
+        'id': 289,
+        'opmask': (0xf109, 0xf10f),
         'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 8, 0),
-            Oper(OpType.UNKNOWN, 'XDn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'XD{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'XDn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'XD{n}'),
+        ),
     },
     {
-        'opmask': (0xf00b, 0xf00f),
-        'm': (0xf0, 0x4),
+        'id': 290,
+        'opmask': (0xf00b, 0xf01f),
+        'm': (0xe0, 0x5),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -8, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'R{n}', True, False, -8, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0xf00b, 0xf00f),
-        'm': (0xf0, 0x4),
+        'id': 291,
+        'opmask': (0xf01b, 0xf01f),
+        'm': (0xe0, 0x5),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'XDm', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -8, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'XD{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'R{n}', True, False, -8, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'XDm'),
+            (InstructionTextTokenType.RegisterToken, 'XD{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
-        'opmask': (0xf006, 0xf00f),
+        'id': 292,
+        'opmask': (0xf006, 0xf10f),
         'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R0', True, True, 0, 0),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -6937,26 +7797,29 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf006, 0xf00f),
+        'id': 293,
+        'opmask': (0xf106, 0xf10f),
         'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R0', True, True, 0, 0),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'XDn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'XD{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -6965,82 +7828,91 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'XDn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'XD{n}'),
+        ),
     },
     {
-        'opmask': (0xf007, 0xf00f),
-        'm': (0xf0, 0x4),
+        'id': 294,
+        'opmask': (0xf007, 0xf01f),
+        'm': (0xe0, 0x5),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@('),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0xf007, 0xf00f),
-        'm': (0xf0, 0x4),
+        'id': 295,
+        'opmask': (0xf017, 0xf01f),
+        'm': (0xe0, 0x5),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'XDm', False, False, 0, 0),
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'XD{m}', False, False, 0, 0),
             Oper(OpType.REG, 'R0', True, True, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'XDm'),
+            (InstructionTextTokenType.RegisterToken, 'XD{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@('),
             (InstructionTextTokenType.RegisterToken, 'R0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
-        'opmask': (0x30017000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 296,
+        'opmask': (0x30017000, 0xf10ff000),
+        'm': (0xf00000, 0x14),
+        'n': (0xe000000, 0x19),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 8, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A',),
+        'args': (
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@('),
@@ -7049,3546 +7921,4107 @@ OPCODES = (
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, ')'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0x30013000, 0xf00ff000),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 297,
+        'opmask': (0x30013000, 0xf01ff000),
+        'm': (0xe00000, 0x15),
+        'n': (0xf000000, 0x18),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0xfff, 8, False),
+        'dsp': {},
         'cmd': 'fmov.d',
         'width': 8,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
+        'isa': ('SH2A',),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
             Oper(OpType.DISP, '0x{disp:x}', True, True, 0, 2),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmov.d'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@('),
             (InstructionTextTokenType.PossibleAddressToken, '0x{disp:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'R{n}'),
-            (InstructionTextTokenType.TextToken, ')')
-        ],
+            (InstructionTextTokenType.TextToken, ')'),
+        ),
     },
     {
+        'id': 298,
         'opmask': (0xf08d, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fldi0',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fldi0'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 299,
         'opmask': (0xf09d, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fldi1',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fldi1'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 300,
         'opmask': (0xf01d, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'flds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FPUL', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FPUL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'flds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FPUL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FPUL'),
+        ),
     },
     {
+        'id': 301,
         'opmask': (0xf00d, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fsts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FPUL', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fsts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPUL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 302,
         'opmask': (0xf05d, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fabs',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fabs'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 303,
         'opmask': (0xf04d, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fneg',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fneg'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 304,
         'opmask': (0xf000, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fadd',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fadd'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 305,
         'opmask': (0xf001, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fsub',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fsub'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 306,
         'opmask': (0xf002, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmul',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmul'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 307,
         'opmask': (0xf00e, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmac',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'FR0', False, False, 0, 0),
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'FR0', False, False, 0, 0),
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmac'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'FR0'),
+            (InstructionTextTokenType.RegisterToken, 'FR0'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 308,
         'opmask': (0xf003, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fdiv',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fdiv'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 309,
         'opmask': (0xf06d, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fsqrt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fsqrt'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 310,
         'opmask': (0xf004, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fcmp/eq',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fcmp/eq'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 311,
         'opmask': (0xf005, 0xf00f),
         'm': (0xf0, 0x4),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fcmp/gt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fcmp/gt'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 312,
         'opmask': (0xf02d, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'float',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FPUL', False, False, 0, 0),
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'float'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPUL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
+        'id': 313,
         'opmask': (0xf03d, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ftrc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FR{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FPUL', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FPUL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ftrc'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FPUL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FPUL'),
+        ),
     },
     {
+        'id': 314,
         'opmask': (0xf0ed, 0xf0ff),
-        'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
+        'm': (0x300, 0x8),
+        'n': (0xc00, 0xa),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fipr',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'FVm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'FVn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'FV{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'FV{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fipr'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'FVm'),
+            (InstructionTextTokenType.RegisterToken, 'FV{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'FVn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FV{n}'),
+        ),
     },
     {
-        'opmask': (0xf0fd, 0xf0ff),
+        'id': 315,
+        'opmask': (0xf1fd, 0xf3ff),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
+        'n': (0xc00, 0xa),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ftrv',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'XMTRX', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'FVn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'XMTRX', False, False, 0, 0),
+            Oper(OpType.REG, 'FV{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ftrv'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'XMTRX'),
+            (InstructionTextTokenType.RegisterToken, 'XMTRX'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'FVn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FV{n}'),
+        ),
     },
     {
+        'id': 316,
         'opmask': (0xf07d, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fsrra',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.REG, 'FR{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH4A',),
+        'args': (
+            Oper(OpType.REG, 'FR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fsrra'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.RegisterToken, 'FR{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FR{n}'),
+        ),
     },
     {
-        'opmask': (0xf0fd, 0xf0ff),
+        'id': 317,
+        'opmask': (0xf0fd, 0xf1ff),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fsca',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH4A',),
+        'args': (
             Oper(OpType.REG, 'FPUL', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fsca'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPUL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf05d, 0xf0ff),
+        'id': 318,
+        'opmask': (0xf05d, 0xf1ff),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fabs',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fabs'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf04d, 0xf0ff),
+        'id': 319,
+        'opmask': (0xf04d, 0xf1ff),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fneg',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fneg'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf000, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 320,
+        'opmask': (0xf000, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fadd',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fadd'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf001, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 321,
+        'opmask': (0xf001, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fsub',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fsub'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf002, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 322,
+        'opmask': (0xf002, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fmul',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fmul'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf003, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 323,
+        'opmask': (0xf003, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fdiv',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fdiv'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf06d, 0xf0ff),
+        'id': 324,
+        'opmask': (0xf06d, 0xf1ff),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fsqrt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fsqrt'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf004, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 325,
+        'opmask': (0xf004, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fcmp/eq',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fcmp/eq'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf005, 0xf00f),
-        'm': (0xf0, 0x4),
-        'n': (0xf00, 0x8),
+        'id': 326,
+        'opmask': (0xf005, 0xf11f),
+        'm': (0xe0, 0x5),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fcmp/gt',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fcmp/gt'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf02d, 0xf0ff),
+        'id': 327,
+        'opmask': (0xf02d, 0xf1ff),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'float',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FPUL', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'float'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPUL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
-        'opmask': (0xf03d, 0xf0ff),
-        'm': (0xf00, 0x8),
+        'id': 328,
+        'opmask': (0xf03d, 0xf1ff),
+        'm': (0xe00, 0x9),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'ftrc',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.REG, 'FPUL', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'FPUL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'ftrc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FPUL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FPUL'),
+        ),
     },
     {
-        'opmask': (0xf0bd, 0xf0ff),
-        'm': (0xf00, 0x8),
+        'id': 329,
+        'opmask': (0xf0bd, 0xf1ff),
+        'm': (0xe00, 0x9),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fcnvds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'DRm', False, False, 0, 0),
-            Oper(OpType.REG, 'FPUL', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+            Oper(OpType.REG, 'DR{m}', False, False, 0, 0),
+            Oper(OpType.REG, 'FPUL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fcnvds'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'DRm'),
+            (InstructionTextTokenType.RegisterToken, 'DR{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FPUL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FPUL'),
+        ),
     },
     {
-        'opmask': (0xf0ad, 0xf0ff),
+        'id': 330,
+        'opmask': (0xf0ad, 0xf1ff),
         'm': (0x0, 0x0),
-        'n': (0xf00, 0x8),
+        'n': (0xe00, 0x9),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fcnvsd',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FPUL', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'DRn', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'DR{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fcnvsd'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPUL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'DRn')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'DR{n}'),
+        ),
     },
     {
+        'id': 331,
         'opmask': (0x406a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FPSCR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FPSCR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FPSCR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FPSCR'),
+        ),
     },
     {
+        'id': 332,
         'opmask': (0x006a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FPSCR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPSCR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 333,
         'opmask': (0x4066, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'FPSCR', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FPSCR', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FPSCR')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FPSCR'),
+        ),
     },
     {
+        'id': 334,
         'opmask': (0x4062, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FPSCR', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPSCR'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 335,
         'opmask': (0x405a, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', False, False, 0, 0),
-            Oper(OpType.REG, 'FPUL', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FPUL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FPUL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FPUL'),
+        ),
     },
     {
+        'id': 336,
         'opmask': (0x005a, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FPUL', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPUL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 337,
         'opmask': (0x4056, 0xf0ff),
         'm': (0xf00, 0x8),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'lds.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'R{m}', True, False, 4, 0),
-            Oper(OpType.REG, 'FPUL', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'FPUL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'lds.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
             (InstructionTextTokenType.RegisterToken, 'R{m}'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'FPUL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'FPUL'),
+        ),
     },
     {
+        'id': 338,
         'opmask': (0x4052, 0xf0ff),
         'm': (0x0, 0x0),
         'n': (0xf00, 0x8),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'sts.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
             Oper(OpType.REG, 'FPUL', False, False, 0, 0),
-            Oper(OpType.REG, 'R{n}', True, False, -4, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'R{n}', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'sts.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'FPUL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.RegisterToken, 'R{n}')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'R{n}'),
+        ),
     },
     {
+        'id': 339,
         'opmask': (0xfbfd, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'frchg',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH4', 'SH4A'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'frchg'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 340,
         'opmask': (0xf3fd, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fschg',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH2A', 'SH4', 'SH4A'),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fschg'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
+        'id': 341,
         'opmask': (0xf7fd, 0xffff),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'fpchg',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('SH4A',),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'fpchg'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
-        'opmask': (0xf000, 0xffff),
+        'id': 342,
+        'opmask': (0xf000, 0xfeac),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'nopx',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'nopx'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
-        'opmask': (0xf004, 0xff0f),
+        'id': 343,
+        'opmask': (0xf004, 0xfc2c),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x200, 0x9), 'D': (0x80, 0x7)},
         'cmd': 'movx.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ax', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dx', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ax', True, False, 0, 0),
+            Oper(OpType.REG, 'Dx', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movx.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ax'),
+            (InstructionTextTokenType.RegisterToken, 'Ax'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dx')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dx'),
+        ),
     },
     {
-        'opmask': (0xf008, 0xff0f),
+        'id': 344,
+        'opmask': (0xf008, 0xfc2c),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x200, 0x9), 'D': (0x80, 0x7)},
         'cmd': 'movx.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ax', True, False, 2, 0),
-            Oper(OpType.UNKNOWN, 'Dx', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ax', True, False, 2, 0),
+            Oper(OpType.REG, 'Dx', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movx.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ax'),
+            (InstructionTextTokenType.RegisterToken, 'Ax'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dx')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dx'),
+        ),
     },
     {
-        'opmask': (0xf00c, 0xff0f),
+        'id': 345,
+        'opmask': (0xf00c, 0xfc2c),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x200, 0x9), 'D': (0x80, 0x7)},
         'cmd': 'movx.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ax+Ix', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dx', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ax', True, True, 0, 0),
+            Oper(OpType.REG, 'R8', False, False, 0, 0),
+            Oper(OpType.REG, 'Dx', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movx.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ax+Ix'),
+            (InstructionTextTokenType.RegisterToken, 'Ax'),
+            (InstructionTextTokenType.TextToken, '+'),
+            (InstructionTextTokenType.RegisterToken, 'R8'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dx')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dx'),
+        ),
     },
     {
-        'opmask': (0xf004, 0xff0f),
+        'id': 346,
+        'opmask': (0xf024, 0xfc2c),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x200, 0x9), 'D': (0x80, 0x7)},
         'cmd': 'movx.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Da', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ax', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Da', False, False, 0, 0),
+            Oper(OpType.REG, 'Ax', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movx.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Da'),
+            (InstructionTextTokenType.RegisterToken, 'Da'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ax')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ax'),
+        ),
     },
     {
-        'opmask': (0xf008, 0xff0f),
+        'id': 347,
+        'opmask': (0xf028, 0xfc2c),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x200, 0x9), 'D': (0x80, 0x7)},
         'cmd': 'movx.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Da', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ax', True, False, 2, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Da', False, False, 0, 0),
+            Oper(OpType.REG, 'Ax', True, False, 2, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movx.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Da'),
+            (InstructionTextTokenType.RegisterToken, 'Da'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ax'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ax'),
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
-        'opmask': (0xf00c, 0xff0f),
+        'id': 348,
+        'opmask': (0xf02c, 0xfc2c),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x200, 0x9), 'D': (0x80, 0x7)},
         'cmd': 'movx.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Da', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ax+Ix', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Da', False, False, 0, 0),
+            Oper(OpType.REG, 'Ax', True, True, 0, 0),
+            Oper(OpType.REG, 'R8', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movx.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Da'),
+            (InstructionTextTokenType.RegisterToken, 'Da'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ax+Ix')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ax'),
+            (InstructionTextTokenType.TextToken, '+'),
+            (InstructionTextTokenType.RegisterToken, 'R8'),
+        ),
     },
     {
-        'opmask': (0xf000, 0xff00),
+        'id': 349,
+        'opmask': (0xf000, 0xfd53),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {},
         'cmd': 'nopy',
         'width': 0,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'nopy'),
-            (InstructionTextTokenType.TextToken, ' ')
-        ],
+            (InstructionTextTokenType.TextToken, ' '),
+        ),
     },
     {
-        'opmask': (0xf000, 0xff00),
+        'id': 350,
+        'opmask': (0xf001, 0xfc13),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x100, 0x8), 'D': (0x40, 0x6)},
         'cmd': 'movy.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ay', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dy', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ay', True, False, 0, 0),
+            Oper(OpType.REG, 'Dy', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movy.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ay'),
+            (InstructionTextTokenType.RegisterToken, 'Ay'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dy')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dy'),
+        ),
     },
     {
-        'opmask': (0xf000, 0xff00),
+        'id': 351,
+        'opmask': (0xf002, 0xfc13),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x100, 0x8), 'D': (0x40, 0x6)},
         'cmd': 'movy.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ay', True, False, 2, 0),
-            Oper(OpType.UNKNOWN, 'Dy', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ay', True, False, 2, 0),
+            Oper(OpType.REG, 'Dy', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movy.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ay'),
+            (InstructionTextTokenType.RegisterToken, 'Ay'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dy')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dy'),
+        ),
     },
     {
-        'opmask': (0xf000, 0xff00),
+        'id': 352,
+        'opmask': (0xf003, 0xfc13),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x100, 0x8), 'D': (0x40, 0x6)},
         'cmd': 'movy.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ay+Iy', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dy', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ay', True, True, 0, 0),
+            Oper(OpType.REG, 'R9', False, False, 0, 0),
+            Oper(OpType.REG, 'Dy', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movy.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ay+Iy'),
+            (InstructionTextTokenType.RegisterToken, 'Ay'),
+            (InstructionTextTokenType.TextToken, '+'),
+            (InstructionTextTokenType.RegisterToken, 'R9'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dy')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dy'),
+        ),
     },
     {
-        'opmask': (0xf000, 0xff00),
+        'id': 353,
+        'opmask': (0xf011, 0xfc13),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x100, 0x8), 'D': (0x40, 0x6)},
         'cmd': 'movy.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Da', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ay', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Da', False, False, 0, 0),
+            Oper(OpType.REG, 'Ay', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movy.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Da'),
+            (InstructionTextTokenType.RegisterToken, 'Da'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ay')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ay'),
+        ),
     },
     {
-        'opmask': (0xf000, 0xff00),
+        'id': 354,
+        'opmask': (0xf012, 0xfc13),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x100, 0x8), 'D': (0x40, 0x6)},
         'cmd': 'movy.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Da', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ay', True, False, 2, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Da', False, False, 0, 0),
+            Oper(OpType.REG, 'Ay', True, False, 2, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movy.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Da'),
+            (InstructionTextTokenType.RegisterToken, 'Da'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ay'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ay'),
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
-        'opmask': (0xf000, 0xff00),
+        'id': 355,
+        'opmask': (0xf013, 0xfc13),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x100, 0x8), 'D': (0x40, 0x6)},
         'cmd': 'movy.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Da', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ay+Iy', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Da', False, False, 0, 0),
+            Oper(OpType.REG, 'Ay', True, True, 0, 0),
+            Oper(OpType.REG, 'R9', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movy.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Da'),
+            (InstructionTextTokenType.RegisterToken, 'Da'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'Ay+Iy')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ay'),
+            (InstructionTextTokenType.TextToken, '+'),
+            (InstructionTextTokenType.RegisterToken, 'R9'),
+        ),
     },
     {
-        'opmask': (0xf400, 0xff0f),
+        'id': 356,
+        'opmask': (0xf400, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'As', True, False, -2, 0),
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'As', True, False, -2, 0),
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.TextToken, 'As'),
+            (InstructionTextTokenType.RegisterToken, 'As'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Ds')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
+        ),
     },
     {
-        'opmask': (0xf404, 0xff0f),
+        'id': 357,
+        'opmask': (0xf404, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'As', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'As', True, False, 0, 0),
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As'),
+            (InstructionTextTokenType.RegisterToken, 'As'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Ds')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
+        ),
     },
     {
-        'opmask': (0xf408, 0xff0f),
+        'id': 358,
+        'opmask': (0xf408, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'As', True, False, 2, 0),
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'As', True, False, 2, 0),
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As'),
+            (InstructionTextTokenType.RegisterToken, 'As'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Ds')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
+        ),
     },
     {
-        'opmask': (0xf40c, 0xff0f),
+        'id': 359,
+        'opmask': (0xf40c, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'As+Ix', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'As', True, True, 0, 0),
+            Oper(OpType.REG, 'R8', False, False, 0, 0),
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.w'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As+Ix'),
+            (InstructionTextTokenType.RegisterToken, 'As'),
+            (InstructionTextTokenType.TextToken, '+'),
+            (InstructionTextTokenType.RegisterToken, 'R8'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Ds')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
+        ),
     },
     {
-        'opmask': (0xf401, 0xff0f),
+        'id': 360,
+        'opmask': (0xf401, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'As', True, False, -2, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+            Oper(OpType.REG, 'As', True, False, -2, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Ds'),
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.TextToken, 'As')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'As'),
+        ),
     },
     {
-        'opmask': (0xf405, 0xff0f),
+        'id': 361,
+        'opmask': (0xf405, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'As', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+            Oper(OpType.REG, 'As', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Ds'),
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'As'),
+        ),
     },
     {
-        'opmask': (0xf409, 0xff0f),
+        'id': 362,
+        'opmask': (0xf409, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'As', True, False, 2, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+            Oper(OpType.REG, 'As', True, False, 2, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Ds'),
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'As'),
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
-        'opmask': (0xf40d, 0xff0f),
+        'id': 363,
+        'opmask': (0xf40d, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.w',
         'width': 2,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'As+Is', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+            Oper(OpType.REG, 'As', True, True, 0, 0),
+            Oper(OpType.REG, 'R8', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.w'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Ds'),
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As+Is')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'As'),
+            (InstructionTextTokenType.TextToken, '+'),
+            (InstructionTextTokenType.RegisterToken, 'R8'),
+        ),
     },
     {
-        'opmask': (0xf402, 0xff0f),
+        'id': 364,
+        'opmask': (0xf402, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'As', True, False, -4, 0),
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'As', True, False, -4, 0),
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.TextToken, 'As'),
+            (InstructionTextTokenType.RegisterToken, 'As'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Ds')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
+        ),
     },
     {
-        'opmask': (0xf406, 0xff0f),
+        'id': 365,
+        'opmask': (0xf406, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'As', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'As', True, False, 0, 0),
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As'),
+            (InstructionTextTokenType.RegisterToken, 'As'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Ds')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
+        ),
     },
     {
-        'opmask': (0xf40a, 0xff0f),
+        'id': 366,
+        'opmask': (0xf40a, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'As', True, False, 4, 0),
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'As', True, False, 4, 0),
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As'),
+            (InstructionTextTokenType.RegisterToken, 'As'),
             (InstructionTextTokenType.TextToken, '+'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Ds')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
+        ),
     },
     {
-        'opmask': (0xf40e, 0xff0f),
+        'id': 367,
+        'opmask': (0xf40e, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'As+Is', True, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'As', True, True, 0, 0),
+            Oper(OpType.REG, 'R8', False, False, 0, 0),
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.l'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As+Is'),
+            (InstructionTextTokenType.RegisterToken, 'As'),
+            (InstructionTextTokenType.TextToken, '+'),
+            (InstructionTextTokenType.RegisterToken, 'R8'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Ds')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
+        ),
     },
     {
-        'opmask': (0xf403, 0xff0f),
+        'id': 368,
+        'opmask': (0xf403, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'As', True, False, -4, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+            Oper(OpType.REG, 'As', True, False, -4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.l'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Ds'),
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@-'),
-            (InstructionTextTokenType.TextToken, 'As')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'As'),
+        ),
     },
     {
-        'opmask': (0xf407, 0xff0f),
+        'id': 369,
+        'opmask': (0xf407, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'As', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+            Oper(OpType.REG, 'As', True, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.l'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Ds'),
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'As'),
+        ),
     },
     {
-        'opmask': (0xf40b, 0xff0f),
+        'id': 370,
+        'opmask': (0xf40b, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'As', True, False, 4, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+            Oper(OpType.REG, 'As', True, False, 4, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.l'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Ds'),
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As'),
-            (InstructionTextTokenType.TextToken, '+')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'As'),
+            (InstructionTextTokenType.TextToken, '+'),
+        ),
     },
     {
-        'opmask': (0xf40f, 0xff0f),
+        'id': 371,
+        'opmask': (0xf40f, 0xfc0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'A': (0x300, 0x8), 'D': (0xf0, 0x4)},
         'cmd': 'movs.l',
         'width': 4,
         'size': 2,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Ds', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'As+Is', True, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Ds', False, False, 0, 0),
+            Oper(OpType.REG, 'As', True, True, 0, 0),
+            Oper(OpType.REG, 'R8', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'movs.l'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Ds'),
+            (InstructionTextTokenType.RegisterToken, 'Ds'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
             (InstructionTextTokenType.TextToken, '@'),
-            (InstructionTextTokenType.TextToken, 'As+Is')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'As'),
+            (InstructionTextTokenType.TextToken, '+'),
+            (InstructionTextTokenType.RegisterToken, 'R8'),
+        ),
     },
     {
-        'opmask': (0xf8008800, 0xff00ff00),
+        'id': 372,
+        'opmask': (0xf8008800, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'pabs',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pabs'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a800, 0xff00fff0),
+        'id': 373,
+        'opmask': (0xf800a800, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pabs',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pabs'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b100, 0xff00ff00),
+        'id': 374,
+        'opmask': (0xf800b100, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'padd',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'padd'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b200, 0xff00ff00),
+        'id': 375,
+        'opmask': (0xf800b200, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct padd',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct padd'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b300, 0xff00ff00),
+        'id': 376,
+        'opmask': (0xf800b300, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf padd',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf padd'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b000, 0xff00ff00),
+        'id': 377,
+        'opmask': (0xf800b000, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'paddc',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'paddc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008d00, 0xff00fff0),
+        'id': 378,
+        'opmask': (0xf8008d00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'pclr',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pclr'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008e00, 0xff00fff0),
+        'id': 379,
+        'opmask': (0xf8008e00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dct pclr',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pclr'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008f00, 0xff00fff0),
+        'id': 380,
+        'opmask': (0xf8008f00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dcf pclr',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pclr'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008400, 0xff00ff0f),
+        'id': 381,
+        'opmask': (0xf8008400, 0xfc00ff0f),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4)},
         'cmd': 'pcmp',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pcmp'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
+        ),
     },
     {
-        'opmask': (0xf800d900, 0xff00ff00),
+        'id': 382,
+        'opmask': (0xf800d900, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'pcopy',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pcopy'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800f900, 0xff00fff0),
+        'id': 383,
+        'opmask': (0xf800f900, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pcopy',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pcopy'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800da00, 0xff00ff00),
+        'id': 384,
+        'opmask': (0xf800da00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dct pcopy',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pcopy'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800fa00, 0xff00fff0),
+        'id': 385,
+        'opmask': (0xf800fa00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct pcopy',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pcopy'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800db00, 0xff00ff00),
+        'id': 386,
+        'opmask': (0xf800db00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dcf pcopy',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pcopy'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800fb00, 0xff00fff0),
+        'id': 387,
+        'opmask': (0xf800fb00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf pcopy',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pcopy'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800c900, 0xff00ff00),
+        'id': 388,
+        'opmask': (0xf800c900, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'pneg',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pneg'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800e900, 0xff00fff0),
+        'id': 389,
+        'opmask': (0xf800e900, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pneg',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pneg'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800ca00, 0xff00ff00),
+        'id': 390,
+        'opmask': (0xf800ca00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dct pneg',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pneg'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800ea00, 0xff00fff0),
+        'id': 391,
+        'opmask': (0xf800ea00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct pneg',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pneg'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800cb00, 0xff00ff00),
+        'id': 392,
+        'opmask': (0xf800cb00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dcf pneg',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pneg'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800eb00, 0xff00fff0),
+        'id': 393,
+        'opmask': (0xf800eb00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf pneg',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pneg'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a100, 0xff00ff00),
+        'id': 394,
+        'opmask': (0xf800a100, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'psub',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'psub'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a200, 0xff00ff00),
+        'id': 395,
+        'opmask': (0xf800a200, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct psub',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct psub'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a300, 0xff00ff00),
+        'id': 396,
+        'opmask': (0xf800a300, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf psub',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf psub'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a000, 0xff00ff00),
+        'id': 397,
+        'opmask': (0xf800a000, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'psubc',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'psubc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008900, 0xff00ff00),
+        'id': 398,
+        'opmask': (0xf8008900, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'pdec',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pdec'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a900, 0xff00fff0),
+        'id': 399,
+        'opmask': (0xf800a900, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pdec',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pdec'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008a00, 0xff00ff00),
+        'id': 400,
+        'opmask': (0xf8008a00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dct pdec',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pdec'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800aa00, 0xff00fff0),
+        'id': 401,
+        'opmask': (0xf800aa00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct pdec',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pdec'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008b00, 0xff00ff00),
+        'id': 402,
+        'opmask': (0xf8008b00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dcf pdec',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pdec'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800ab00, 0xff00fff0),
+        'id': 403,
+        'opmask': (0xf800ab00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf pdec',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pdec'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009900, 0xff00ff00),
+        'id': 404,
+        'opmask': (0xf8009900, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'pinc',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pinc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b900, 0xff00fff0),
+        'id': 405,
+        'opmask': (0xf800b900, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pinc',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pinc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009a00, 0xff00ff00),
+        'id': 406,
+        'opmask': (0xf8009a00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dct pinc',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pinc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800ba00, 0xff00fff0),
+        'id': 407,
+        'opmask': (0xf800ba00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct pinc',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pinc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009b00, 0xff00ff00),
+        'id': 408,
+        'opmask': (0xf8009b00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dcf pinc',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pinc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800bb00, 0xff00fff0),
+        'id': 409,
+        'opmask': (0xf800bb00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf pinc',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pinc'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009d00, 0xff00ff00),
+        'id': 410,
+        'opmask': (0xf8009d00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'pdmsb',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pdmsb'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800bd00, 0xff00fff0),
+        'id': 411,
+        'opmask': (0xf800bd00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pdmsb',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pdmsb'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009e00, 0xff00ff00),
+        'id': 412,
+        'opmask': (0xf8009e00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dct pdmsb',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pdmsb'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800be00, 0xff00fff0),
+        'id': 413,
+        'opmask': (0xf800be00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct pdmsb',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pdmsb'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009f00, 0xff00ff00),
+        'id': 414,
+        'opmask': (0xf8009f00, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'dcf pdmsb',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pdmsb'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800bf00, 0xff00fff0),
+        'id': 415,
+        'opmask': (0xf800bf00, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf pdmsb',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pdmsb'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009800, 0xff00ff00),
+        'id': 416,
+        'opmask': (0xf8009800, 0xfc00ff30),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'z': (0xf, 0x0)},
         'cmd': 'prnd',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'prnd'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b800, 0xff00fff0),
+        'id': 417,
+        'opmask': (0xf800b800, 0xfc00ffc0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'prnd',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'prnd'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009500, 0xff00ff00),
+        'id': 418,
+        'opmask': (0xf8009500, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pand',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pand'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009600, 0xff00ff00),
+        'id': 419,
+        'opmask': (0xf8009600, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct pand',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pand'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009700, 0xff00ff00),
+        'id': 420,
+        'opmask': (0xf8009700, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf pand',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pand'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b500, 0xff00ff00),
+        'id': 421,
+        'opmask': (0xf800b500, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'por',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'por'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b600, 0xff00ff00),
+        'id': 422,
+        'opmask': (0xf800b600, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct por',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct por'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800b700, 0xff00ff00),
+        'id': 423,
+        'opmask': (0xf800b700, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf por',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf por'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a500, 0xff00ff00),
+        'id': 424,
+        'opmask': (0xf800a500, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pxor',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pxor'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a600, 0xff00ff00),
+        'id': 425,
+        'opmask': (0xf800a600, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct pxor',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pxor'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800a700, 0xff00ff00),
+        'id': 426,
+        'opmask': (0xf800a700, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf pxor',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pxor'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8004000, 0xff00f0f0),
+        'id': 427,
+        'opmask': (0xf8004000, 0xfc00f0f3),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'e': (0xc00, 0xa), 'f': (0x300, 0x8), 'g': (0xc, 0x2)},
         'cmd': 'pmuls',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Se', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sf', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dg', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Se', False, False, 0, 0),
+            Oper(OpType.REG, 'Sf', False, False, 0, 0),
+            Oper(OpType.REG, 'Dg', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pmuls'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Se'),
+            (InstructionTextTokenType.RegisterToken, 'Se'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sf'),
+            (InstructionTextTokenType.RegisterToken, 'Sf'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dg')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dg'),
+        ),
     },
     {
-        'opmask': (0xf8009100, 0xff00ff00),
+        'id': 428,
+        'opmask': (0xf8009100, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'psha',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'psha'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009200, 0xff00ff00),
+        'id': 429,
+        'opmask': (0xf8009200, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct psha',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct psha'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8009300, 0xff00ff00),
+        'id': 430,
+        'opmask': (0xf8009300, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf psha',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf psha'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8000000, 0xff00ff00),
+        'id': 431,
+        'opmask': (0xf8000000, 0xfc00f800),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'imm': (0x7f0, 0x4),
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'psha',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'psha'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008100, 0xff00ff00),
+        'id': 432,
+        'opmask': (0xf8008100, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'pshl',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pshl'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008200, 0xff00ff00),
+        'id': 433,
+        'opmask': (0xf8008200, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dct pshl',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct pshl'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8008300, 0xff00ff00),
+        'id': 434,
+        'opmask': (0xf8008300, 0xfc00ff00),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'x': (0xc0, 0x6), 'y': (0x30, 0x4), 'z': (0xf, 0x0)},
         'cmd': 'dcf pshl',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Sx', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Sy', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf pshl'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Sx'),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Sy'),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf8001000, 0xff00ff00),
+        'id': 435,
+        'opmask': (0xf8001000, 0xfc00f800),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
-        'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'imm': (0x7f0, 0x4),
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'pshl',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.IMM, '0x{imm:x}', False, False, 0, 1),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'pshl'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.IntegerToken, '0x{imm:x}'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800ed00, 0xff00fff0),
+        'id': 436,
+        'opmask': (0xf800ed00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'plds',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0),
-            Oper(OpType.REG, 'MACH', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+            Oper(OpType.REG, 'MACH', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'plds'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz'),
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACH')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACH'),
+        ),
     },
     {
-        'opmask': (0xf800fd00, 0xff00fff0),
+        'id': 437,
+        'opmask': (0xf800fd00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'plds',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0),
-            Oper(OpType.REG, 'MACL', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+            Oper(OpType.REG, 'MACL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'plds'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz'),
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACL'),
+        ),
     },
     {
-        'opmask': (0xf800ee00, 0xff00fff0),
+        'id': 438,
+        'opmask': (0xf800ee00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dct plds',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0),
-            Oper(OpType.REG, 'MACH', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+            Oper(OpType.REG, 'MACH', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct plds'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz'),
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACH')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACH'),
+        ),
     },
     {
-        'opmask': (0xf800fe00, 0xff00fff0),
+        'id': 439,
+        'opmask': (0xf800fe00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dct plds',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0),
-            Oper(OpType.REG, 'MACL', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+            Oper(OpType.REG, 'MACL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct plds'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz'),
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACL'),
+        ),
     },
     {
-        'opmask': (0xf800ef00, 0xff00fff0),
+        'id': 440,
+        'opmask': (0xf800ef00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dcf plds',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0),
-            Oper(OpType.REG, 'MACH', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+            Oper(OpType.REG, 'MACH', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf plds'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz'),
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACH')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACH'),
+        ),
     },
     {
-        'opmask': (0xf800ff00, 0xff00fff0),
+        'id': 441,
+        'opmask': (0xf800ff00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dcf plds',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0),
-            Oper(OpType.REG, 'MACL', False, False, 0, 0)
-        ],
-        'tokens': [
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+            Oper(OpType.REG, 'MACL', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf plds'),
             (InstructionTextTokenType.TextToken, ' '),
-            (InstructionTextTokenType.TextToken, 'Dz'),
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.RegisterToken, 'MACL')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'MACL'),
+        ),
     },
     {
-        'opmask': (0xf800cd00, 0xff00fff0),
+        'id': 442,
+        'opmask': (0xf800cd00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'psts',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'MACH', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'psts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACH'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800dd00, 0xff00fff0),
+        'id': 443,
+        'opmask': (0xf800dd00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'psts',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'MACL', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'psts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800ce00, 0xff00fff0),
+        'id': 444,
+        'opmask': (0xf800ce00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dct psts',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'MACH', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct psts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACH'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800de00, 0xff00fff0),
+        'id': 445,
+        'opmask': (0xf800de00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dct psts',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'MACL', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dct psts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800cf00, 0xff00fff0),
+        'id': 446,
+        'opmask': (0xf800cf00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dcf psts',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'MACH', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf psts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACH'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
     },
     {
-        'opmask': (0xf800df00, 0xff00fff0),
+        'id': 447,
+        'opmask': (0xf800df00, 0xfc00fff0),
         'm': (0x0, 0x0),
         'n': (0x0, 0x0),
         'imm': (0x0, 0x0),
-        'disp': 0x0,
+        'disp': (0x0, 1, False),
+        'dsp': {'z': (0xf, 0x0)},
         'cmd': 'dcf psts',
         'width': 0,
         'size': 4,
         'is_label': False,
         'is_delay': False,
-        'args': [
+        'isa': ('DSP',),
+        'args': (
             Oper(OpType.REG, 'MACL', False, False, 0, 0),
-            Oper(OpType.UNKNOWN, 'Dz', False, False, 0, 0)
-        ],
-        'tokens': [
+            Oper(OpType.REG, 'Dz', False, False, 0, 0),
+        ),
+        'tokens': (
             (InstructionTextTokenType.InstructionToken, 'dcf psts'),
             (InstructionTextTokenType.TextToken, ' '),
             (InstructionTextTokenType.RegisterToken, 'MACL'),
             (InstructionTextTokenType.OperandSeparatorToken, ', '),
-            (InstructionTextTokenType.TextToken, 'Dz')
-        ],
+            (InstructionTextTokenType.RegisterToken, 'Dz'),
+        ),
+    },
+    {
+        'id': 448,
+        'opmask': (0xf8007000, 0xfc00f000),
+        'm': (0x0, 0x0),
+        'n': (0x0, 0x0),
+        'imm': (0x0, 0x0),
+        'disp': (0x0, 1, False),
+        'dsp': {'e': (0xc00, 0xa), 'f': (0x300, 0x8), 'g': (0xc, 0x2), 'u': (0x3, 0x0), 'x': (0xc0, 0x6), 'y': (0x30, 0x4)},
+        'cmd': 'padd pmuls',
+        'width': 0,
+        'size': 4,
+        'is_label': False,
+        'is_delay': False,
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Du', False, False, 0, 0),
+            Oper(OpType.REG, 'Se', False, False, 0, 0),
+            Oper(OpType.REG, 'Sf', False, False, 0, 0),
+            Oper(OpType.REG, 'Dg', False, False, 0, 0),
+        ),
+        'tokens': (
+            (InstructionTextTokenType.InstructionToken, 'padd'),
+            (InstructionTextTokenType.TextToken, ' '),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
+            (InstructionTextTokenType.OperandSeparatorToken, ', '),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
+            (InstructionTextTokenType.OperandSeparatorToken, ', '),
+            (InstructionTextTokenType.RegisterToken, 'Du'),
+            (InstructionTextTokenType.TextToken, ' '),
+            (InstructionTextTokenType.InstructionToken, 'pmuls'),
+            (InstructionTextTokenType.TextToken, ' '),
+            (InstructionTextTokenType.RegisterToken, 'Se'),
+            (InstructionTextTokenType.OperandSeparatorToken, ', '),
+            (InstructionTextTokenType.RegisterToken, 'Sf'),
+            (InstructionTextTokenType.OperandSeparatorToken, ', '),
+            (InstructionTextTokenType.RegisterToken, 'Dg'),
+        ),
+    },
+    {
+        'id': 449,
+        'opmask': (0xf8006000, 0xfc00f000),
+        'm': (0x0, 0x0),
+        'n': (0x0, 0x0),
+        'imm': (0x0, 0x0),
+        'disp': (0x0, 1, False),
+        'dsp': {'e': (0xc00, 0xa), 'f': (0x300, 0x8), 'g': (0xc, 0x2), 'u': (0x3, 0x0), 'x': (0xc0, 0x6), 'y': (0x30, 0x4)},
+        'cmd': 'psub pmuls',
+        'width': 0,
+        'size': 4,
+        'is_label': False,
+        'is_delay': False,
+        'isa': ('DSP',),
+        'args': (
+            Oper(OpType.REG, 'Sx', False, False, 0, 0),
+            Oper(OpType.REG, 'Sy', False, False, 0, 0),
+            Oper(OpType.REG, 'Du', False, False, 0, 0),
+            Oper(OpType.REG, 'Se', False, False, 0, 0),
+            Oper(OpType.REG, 'Sf', False, False, 0, 0),
+            Oper(OpType.REG, 'Dg', False, False, 0, 0),
+        ),
+        'tokens': (
+            (InstructionTextTokenType.InstructionToken, 'psub'),
+            (InstructionTextTokenType.TextToken, ' '),
+            (InstructionTextTokenType.RegisterToken, 'Sx'),
+            (InstructionTextTokenType.OperandSeparatorToken, ', '),
+            (InstructionTextTokenType.RegisterToken, 'Sy'),
+            (InstructionTextTokenType.OperandSeparatorToken, ', '),
+            (InstructionTextTokenType.RegisterToken, 'Du'),
+            (InstructionTextTokenType.TextToken, ' '),
+            (InstructionTextTokenType.InstructionToken, 'pmuls'),
+            (InstructionTextTokenType.TextToken, ' '),
+            (InstructionTextTokenType.RegisterToken, 'Se'),
+            (InstructionTextTokenType.OperandSeparatorToken, ', '),
+            (InstructionTextTokenType.RegisterToken, 'Sf'),
+            (InstructionTextTokenType.OperandSeparatorToken, ', '),
+            (InstructionTextTokenType.RegisterToken, 'Dg'),
+        ),
     },
 )
+
+# SH-DSP parallel instructions: IDs of the X and Y data transfers, which
+# share one 16-bit word, and of the ALU operations, whose 32-bit word
+# carries an X/Y transfer pair in the low 10 bits of the first halfword
+DSP_PARALLEL = {
+    'x': (342, 343, 344, 345, 346, 347, 348),
+    'y': (349, 350, 351, 352, 353, 354, 355),
+    'alu': (372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383, 384, 385, 386, 387, 388, 389, 390, 391, 392, 393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403, 404, 405, 406, 407, 408, 409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419, 420, 421, 422, 423, 424, 425, 426, 427, 428, 429, 430, 431, 432, 433, 434, 435, 436, 437, 438, 439, 440, 441, 442, 443, 444, 445, 446, 447, 448, 449),
+}
@@ -0,0 +1,247 @@
+"""Static analysis of how the OPCODES encodings overlap
+
+Every opcode is a cube in encoding space: the bits under its mask are fixed,
+the rest are free. Two opcodes of the same size overlap when their fixed bits
+agree wherever both masks are set, so most of the questions below are
+answered from the masks alone without enumerating words.
+"""
+
+# Registers and instructions that only exist on SH-DSP cores
+_DSP_OPERANDS = frozenset([
+    'Ax', 'Ay', 'Dx', 'Dy', 'Da', 'As', 'Ds', 'Sx', 'Sy', 'Dz',
+    'Se', 'Sf', 'Dg', 'Du',
+    'DSR', 'A0', 'X0', 'X1', 'Y0', 'Y1', 'MOD', 'RE', 'RS',
+])
+_DSP_CMDS = frozenset(['nopx', 'nopy', 'setrc', 'ldrs', 'ldre'])
+
+# SH-DSP Y data transfers, a 16-bit word with both an X and a Y transfer
+# decodes as the X one with the Y one as its parallel part
+_DSP_Y_CMDS = frozenset(['nopy', 'movy.w'])
+
+# Register pair operands, only meaningful with FPSCR.SZ or FPSCR.PR set
+PAIR_OPERANDS = frozenset(['DR{m}', 'DR{n}', 'XD{m}', 'XD{n}'])
+
+# Commands whose single or pair form is selected by FPSCR.SZ, the other
+# pair forms are selected by FPSCR.PR
+_SZ_CMDS = frozenset(['fmov', 'fmov.s', 'fmov.d'])
+
+FAMILY_BASE = 0
+FAMILY_FPU_PAIR = 1
+FAMILY_DSP = 2
+FAMILY_DSP_Y = 3
+
+# FPU modes: FPSCR.PR and FPSCR.SZ as bits of a mode number, 0 is the
+# reset state
+MODE_PR = 1
+MODE_SZ = 2
+FPU_MODES = (0, MODE_PR, MODE_SZ, MODE_SZ | MODE_PR)
+
+
+def family(opcode):
+    """Rank of the ISA extension an opcode belongs to
+
+    SH-DSP and FPU encodings share the 0xFxxx space but never exist on the
+    same core, and pair-register forms depend on FPSCR. Specificity is only
+    compared inside a family; across families the lower rank wins.
+    """
+    if opcode["cmd"] in _DSP_Y_CMDS:
+        return FAMILY_DSP_Y
+    if opcode["cmd"] in _DSP_CMDS:
+        return FAMILY_DSP
+    fmts = set(oper.fmt_str for oper in opcode["args"])
+    if fmts & _DSP_OPERANDS:
+        return FAMILY_DSP
+    if fmts & PAIR_OPERANDS:
+        return FAMILY_FPU_PAIR
+    return FAMILY_BASE
+
+
+def _pair_cmds(opcodes):
+    """Commands that have a pair-register form"""
+    return frozenset(
+        opcode["cmd"] for opcode in opcodes if family(opcode) == FAMILY_FPU_PAIR
+    )
+
+
+def mode_family(opcode, mode, pair_cmds):
+    """family() of opcode under an FPU mode
+
+    The form selected by the mode ranks as a base opcode and the other one
+    as a pair opcode, so the mode decides between fmov FRm,FRn and
+    fmov DRm,DRn (SZ) or fadd FRm,FRn and fadd DRm,DRn (PR). Mode 0 is
+    family() itself.
+    """
+    rank = family(opcode)
+    if rank >= FAMILY_DSP:
+        return rank
+    if opcode["cmd"] in _SZ_CMDS:
+        bit = MODE_SZ
+    elif opcode["cmd"] in pair_cmds:
+        bit = MODE_PR
+    else:
+        return rank
+    if bool(mode & bit) == (rank == FAMILY_FPU_PAIR):
+        return FAMILY_BASE
+    return FAMILY_FPU_PAIR
+
+
+def encodings(instbits, instmask, width_mask):
+    """Yield every word matching instbits under instmask by walking the free bits"""
+    instbits &= instmask
+    free = ~instmask & width_mask
+
+    sub = free
+    while True:
+        yield instbits | sub
+        if sub == 0:
+            break
+        sub = (sub - 1) & free
+
+
+def specificity(opcode):
+    """Number of fixed bits in the opcode mask"""
+    return bin(opcode['opmask'][1]).count("1")
+
+
+def overlaps(a, b):
+    """True if some word is matched by both opcodes"""
+    if a["size"] != b["size"]:
+        return False
+    abits, amask = a['opmask']
+    bbits, bmask = b['opmask']
+    return (abits ^ bbits) & amask & bmask == 0
+
+
+def relation(a, b):
+    """Classify two overlapping opcodes
+
+    Returns 'duplicate' for identical encodings, 'subset' when every
+    encoding of a is also one of b, 'superset' for the reverse and
+    'partial' otherwise.
+    """
+    amask = a['opmask'][1]
+    bmask = b['opmask'][1]
+    if amask == bmask:
+        return 'duplicate'
+    if amask & bmask == bmask:
+        return 'subset'
+    if amask & bmask == amask:
+        return 'superset'
+    return 'partial'
+
+
+def witness(a, b):
+    """Lowest word matched by both overlapping opcodes"""
+    abits, amask = a['opmask']
+    bbits, bmask = b['opmask']
+    return (abits & amask) | (bbits & bmask)
+
+
+def priority_order(opcodes, mode=0):
+    """Canonical decode priority: family, then most specific first
+
+    Families are taken under the FPU mode, see mode_family(). Ties keep the
+    OPCODES order so the result is stable for a given table.
+    """
+    pair_cmds = _pair_cmds(opcodes)
+    return sorted(
+        range(len(opcodes)),
+        key=lambda idx: (
+            mode_family(opcodes[idx], mode, pair_cmds),
+            -specificity(opcodes[idx]),
+            idx
+        )
+    )
+
+
+def find_overlaps(opcodes):
+    """Yield (i, j, relation) for every overlapping pair with i < j"""
+    for i, a in enumerate(opcodes):
+        for j in range(i + 1, len(opcodes)):
+            b = opcodes[j]
+            if overlaps(a, b):
+                yield (i, j, relation(a, b))
+
+
+def ambiguous(opcodes):
+    """Overlapping pairs whose winner is not decided by specificity
+
+    These are duplicates, partial overlaps and any overlap between two
+    families; the priority order still resolves them, but only by rule.
+    """
+    for i, j, rel in find_overlaps(opcodes):
+        a = opcodes[i]
+        b = opcodes[j]
+        if family(a) != family(b) or rel in ('duplicate', 'partial'):
+            yield (i, j, rel)
+
+
+def check_decoder(opcodes, order, lookup, accepts=None):
+    """Check lookup(word, size) against a scan of opcodes in priority order
+
+    Rather than all 2**32 words, only the base word of every opcode and the
+    witness word of every overlapping pair are tested: these are the only
+    places where the order can change the answer. lookup returns an index
+    into opcodes or None, accepts(opcode, word), when given, rejects words
+    an opcode matches by mask but does not encode. Returns a list of (word,
+    expected, got).
+    """
+    def expected(word, size):
+        for idx in order:
+            opcode = opcodes[idx]
+            if opcode["size"] != size:
+                continue
+            instbits, instmask = opcode['opmask']
+            if word & instmask == instbits & instmask \
+                    and (accepts is None or accepts(opcode, word)):
+                return idx
+        return None
+
+    words = set()
+    for opcode in opcodes:
+        words.add((opcode['opmask'][0] & opcode['opmask'][1], opcode["size"]))
+    for i, j, _ in find_overlaps(opcodes):
+        words.add((witness(opcodes[i], opcodes[j]), opcodes[i]["size"]))
+
+    mismatches = list()
+    for word, size in sorted(words):
+        want = expected(word, size)
+        got = lookup(word, size)
+        if got != want:
+            mismatches.append((word, want, got))
+    return mismatches
+
+
+def hidden_32bit(opcodes, order, accepts=None):
+    """32-bit opcodes whose first halfword can decode as a 16-bit opcode
+
+    The decoder tries every halfword as a 16-bit instruction first and only
+    reads a second one when that fails, so a 32-bit opcode is unreachable
+    through any first halfword that a 16-bit opcode in order accepts,
+    whatever their priority. Returns (idx, hidden, total) for each such
+    opcode in order: total is the number of first halfwords it has and
+    hidden how many of them decode as 16-bit instructions.
+    """
+    short = [opcodes[idx] for idx in order if opcodes[idx]["size"] == 2]
+    taken = dict()
+
+    def is_taken(word):
+        if word not in taken:
+            taken[word] = any(
+                word & opcode['opmask'][1] == opcode['opmask'][0] & opcode['opmask'][1]
+                and (accepts is None or accepts(opcode, word))
+                for opcode in short
+            )
+        return taken[word]
+
+    hidden = list()
+    for idx in order:
+        opcode = opcodes[idx]
+        if opcode["size"] != 4:
+            continue
+        instbits, instmask = opcode['opmask']
+        firsts = list(encodings(instbits >> 16, instmask >> 16, 0xffff))
+        count = sum(1 for word in firsts if is_taken(word))
+        if count:
+            hidden.append((idx, count, len(firsts)))
+    return hidden
@@ -0,0 +1,187 @@
+"""Pre-decoded instruction index files (.shidx)
+
+A .shidx file stores one packed 6-byte RECORD per halfword of an image: the
+opcode ID the halfword decodes as (INVALID if none) and the raw instruction
+word, 16 or 32 bits. Like classify(), every halfword position is decoded,
+not a linear sweep. Files are written once by the
+vectorised bulk decoder and reopened with numpy.memmap, so nothing is
+decoded again and records are only paged in when read.
+
+Layout: a HEADER_SIZE byte header (see _HEADER) followed by the records.
+The header holds the SHA-256 of the source image and TABLE_VERSION, a
+digest of the opcode table the IDs refer to; opening a file written
+against another table is an error.
+
+The ID and raw word are all the field extraction needs, so no field is
+stored: insn_at() extracts them with the opcode's compiled steps, which
+also covers the SH-DSP fields and parallel parts.
+"""
+import hashlib
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+from .disasm import OPCODES, PRIORITY_BY_MODE, _decode
+from .classify import INVALID, classify, words_from_bytes
+
+MAGIC = b"SHIDX\0\0\0"
+FORMAT_VERSION = 2
+HEADER_SIZE = 128
+
+# Packed, without alignment padding
+RECORD = np.dtype([
+    ("id", "<i2"),
+    ("raw", "<u4"),
+])
+
+# magic, format version, record size, base address, record count,
+# source SHA-256, table version
+_HEADER = struct.Struct("<8sHHQQ32s16s")
+
+
+# Records hold what classify() decodes: every ISA variant, FPSCR in its
+# reset state
+DECODE_MODE = 0
+DECODE_VARIANT = None
+
+
+def _table_version():
+    """Digest of everything in OPCODES that record contents depend on
+
+    Besides the opcodes themselves that is the priority order, which picks
+    the ID stored for overlapping encodings, and the FPU mode and ISA
+    variant the records are decoded in.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr((
+        DECODE_MODE, DECODE_VARIANT,
+        tuple(opcode["id"] for opcode in PRIORITY_BY_MODE[DECODE_MODE]),
+    )).encode())
+    for opcode in OPCODES:
+        digest.update(repr((
+            opcode["id"], opcode["cmd"], opcode["size"], opcode['opmask'],
+            opcode['m'], opcode['n'], opcode['imm'], opcode['disp'],
+            tuple(oper.fmt_str for oper in opcode["args"]),
+        )).encode())
+    return digest.digest()[:16]
+
+
+TABLE_VERSION = _table_version()
+
+Header = namedtuple("Header", ("base_addr", "count", "source_hash", "table_version"))
+
+
+# Instruction size in bytes by opcode ID
+_SIZES = np.array([opcode["size"] for opcode in OPCODES], dtype=np.uint8)
+
+
+def decode_records(buffer, byteorder="<"):
+    """Decode every halfword of buffer into a RECORD array
+
+    raw is the halfword itself, or joined with the next one where it
+    starts a 32-bit instruction, both in one array operation.
+    """
+    words = words_from_bytes(buffer, byteorder)
+    index = classify(words).index
+
+    records = np.zeros(len(words), dtype=RECORD)
+    records["id"] = index
+
+    raw = words.astype(np.uint32)
+    pos = np.flatnonzero((index != INVALID) & (_SIZES[index] == 4))
+    raw[pos] = (raw[pos] << 16) | words[pos + 1]
+    records["raw"] = raw
+    return records
+
+
+def write(path, buffer, base_addr=0, byteorder="<"):
+    """Bulk decode buffer, loaded at base_addr, into a .shidx file at path
+
+    Records hold decoded values, so a file reads the same whichever byte
+    order the image was in.
+    """
+    records = decode_records(buffer, byteorder)
+    header = Header(base_addr, len(records), hashlib.sha256(buffer).digest(), TABLE_VERSION)
+    with open(path, "wb") as fd:
+        packed = _HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.itemsize, *header)
+        fd.write(packed.ljust(HEADER_SIZE, b"\0"))
+        fd.write(records.tobytes())
+    return header
+
+
+def read_header(path):
+    """Header of the .shidx file at path
+
+    Raises ValueError if it is not a .shidx file or was written by another
+    format or opcode table version.
+    """
+    with open(path, "rb") as fd:
+        raw = fd.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path}: truncated header")
+
+    magic, version, record_size, base_addr, count, source_hash, table_version = \
+        _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a .shidx file")
+    if version != FORMAT_VERSION or record_size != RECORD.itemsize:
+        raise ValueError(f"{path}: format version {version}, expected {FORMAT_VERSION}")
+    if table_version != TABLE_VERSION:
+        raise ValueError(f"{path}: written for another opcode table, rebuild it")
+    return Header(base_addr, count, source_hash, table_version)
+
+
+class SHIndex(namedtuple("SHIndex", ("header", "records"))):
+    """An opened .shidx file, records is a read-only numpy.memmap"""
+    __slots__ = ()
+
+    @property
+    def base_addr(self):
+        return self.header.base_addr
+
+    def _position(self, addr):
+        off = addr - self.header.base_addr
+        if off < 0 or off & 1 or off >> 1 >= self.header.count:
+            return None
+        return off >> 1
+
+    def record_at(self, addr):
+        """The RECORD for the halfword at addr, or None outside the image"""
+        pos = self._position(addr)
+        if pos is None:
+            return None
+        return self.records[pos]
+
+    def insn_at(self, addr):
+        """SHInsn for the instruction at addr, or None
+
+        Built from the stored opcode ID and raw word, the opcode is never
+        looked up again and only the fields of this one instruction are
+        extracted.
+        """
+        record = self.record_at(addr)
+        if record is None or record["id"] == INVALID:
+            return None
+        return _decode(OPCODES[record["id"]], int(record["raw"]), addr)
+
+
+def open_index(path, buffer=None):
+    """Map the .shidx file at path
+
+    When the source buffer is given its hash has to match the one the
+    file was written from.
+    """
+    header = read_header(path)
+    if buffer is not None and hashlib.sha256(buffer).digest() != header.source_hash:
+        raise ValueError(f"{path}: written from a different image")
+
+    if header.count == 0:
+        # numpy.memmap cannot map zero bytes
+        records = np.zeros(0, dtype=RECORD)
+        records.flags.writeable = False
+    else:
+        records = np.memmap(
+            path, dtype=RECORD, mode="r", offset=HEADER_SIZE, shape=(header.count,)
+        )
+    return SHIndex(header, records)
@@ -1,3 +1,6 @@
+import functools
+from collections import namedtuple
+
 from binaryninja import (
     Architecture,
     CallingConvention,
@@ -19,66 +22,40 @@ from binaryninja import (
 )
 from binaryninja.types import Type
 
-from .disasm import disasm_single, SHInsn
-from .opcodes import OpType, Oper
+from .disasm import (
+    DecodeCache,
+    DecodeMemo,
+    MemoStats,
+    disasm_single,
+    disasm_single_be,
+    variant_decoders,
+    MODE_PR,
+    MODE_SZ,
+    AddrMode,
+    MemRef,
+    SHInsn,
+    SHOperand,
+    GENERAL_REGS,
+    FLOAT_REGS,
+    EXTENDED_REGS,
+    PAIR_REGS,
+    EXTENDED_PAIR_REGS,
+    VECTOR_REGS
+)
+from .opcodes import OPCODES, OpType
+from .overlap import PAIR_OPERANDS
 
 EM_SH = 42
 RSIZE = 4
 ISIZE = 2
 
-registers = [
-    "R0",
-    "R1",
-    "R2",
-    "R3",
-    "R4",
-    "R5",
-    "R6",
-    "R7",
-    "R8",
-    "R9",
-    "R10",
-    "R11",
-    "R12",
-    "R13",
-    "R14",
-    "R15",
-    "FR0",
-    "FR1",
-    "FR2",
-    "FR3",
-    "FR4",
-    "FR5",
-    "FR6",
-    "FR7",
-    "FR8",
-    "FR9",
-    "FR10",
-    "FR11",
-    "FR12",
-    "FR13",
-    "FR14",
-    "FR15",
-    "XF0",
-    "XF1",
-    "XF2",
-    "XF3",
-    "XF4",
-    "XF5",
-    "XF6",
-    "XF7",
-    "XF8",
-    "XF9",
-    "XF10",
-    "XF11",
-    "XF12",
-    "XF13",
-    "XF14",
-    "XF15",
+registers = list(GENERAL_REGS + FLOAT_REGS + EXTENDED_REGS) + [
     "A0",
     "A1",
     "M0",
     "M1",
+    "A0G",
+    "A1G",
 ]
 
 control_registers = [
@@ -117,84 +94,75 @@ class DefaultCallingConv(CallingConvention):
     callee_saved_regs = ['R8', 'R9', 'R10', 'R11', 'R12', 'R13', 'R14', 'R15']
 
 
-class Brancher:
-    @classmethod
-    def find_branches(cls, insn, result: InstructionInfo):
-        func_name = 'branch_' + insn.opcode["cmd"].replace("/", "_")
-        if hasattr(cls, func_name):
-            getattr(cls, func_name)(insn, result)
-
-            if insn.opcode["is_delay"]:
-                result.branch_delay = True
-
-    @staticmethod
-    def branch_bf(insn, result: InstructionInfo, size=ISIZE):
-        result.add_branch(BranchType.TrueBranch, insn.opcode["args"][0].val)
-        result.add_branch(BranchType.FalseBranch, insn.addr + size)
-
-    @staticmethod
-    def branch_bf_s(insn, result: InstructionInfo):
-        Brancher.branch_bf(insn, result, size=4)
-
-    @staticmethod
-    def branch_bt(insn, result: InstructionInfo):
-        Brancher.branch_bf(insn, result)
-
-    @staticmethod
-    def branch_bt_s(insn, result: InstructionInfo):
-        Brancher.branch_bf(insn, result, size=4)
-
-    @staticmethod
-    def branch_bra(insn, result: InstructionInfo):
-        result.add_branch(BranchType.UnconditionalBranch, insn.opcode["args"][0].val)
-
-    @staticmethod
-    def branch_braf(insn, result: InstructionInfo):
-        result.add_branch(BranchType.IndirectBranch)
-
-    @staticmethod
-    def branch_bsr(insn, result: InstructionInfo):
-        result.add_branch(BranchType.CallDestination, insn.opcode["args"][0].val)
-
-    @staticmethod
-    def branch_bsrf(insn, result: InstructionInfo):
-        result.add_branch(BranchType.IndirectBranch)
-
-    @staticmethod
-    def branch_jmp(insn, result: InstructionInfo):
-        result.add_branch(BranchType.IndirectBranch)
+class Branch(namedtuple("Branch", ("type", "has_target", "fall_through", "delay"))):
+    """Branch behaviour of an opcode, see Brancher
 
-    @staticmethod
-    def branch_jsr(insn, result: InstructionInfo):
-        result.add_branch(BranchType.IndirectBranch)
+    has_target is set when the first operand is the branch target and
+    fall_through is the distance to the not-taken path of a conditional
+    branch (None for the others).
+    """
+    __slots__ = ()
 
-    @staticmethod
-    def branch_jsr_n(insn, result: InstructionInfo):
-        result.add_branch(BranchType.IndirectBranch)
+class Brancher:
+    # (type, has_target, fall_through) by command
+    BRANCHES = {
+        'bf': (BranchType.TrueBranch, True, ISIZE),
+        'bf/s': (BranchType.TrueBranch, True, 4),
+        'bt': (BranchType.TrueBranch, True, ISIZE),
+        'bt/s': (BranchType.TrueBranch, True, 4),
+        'bra': (BranchType.UnconditionalBranch, True, None),
+        'braf': (BranchType.IndirectBranch, False, None),
+        'bsr': (BranchType.CallDestination, True, None),
+        'bsrf': (BranchType.IndirectBranch, False, None),
+        'jmp': (BranchType.IndirectBranch, False, None),
+        'jsr': (BranchType.IndirectBranch, False, None),
+        'jsr/n': (BranchType.IndirectBranch, False, None),
+        'rts': (BranchType.FunctionReturn, False, None),
+        'rts/n': (BranchType.FunctionReturn, False, None),
+        'rtv/n': (BranchType.FunctionReturn, False, None),
+    }
 
-    @staticmethod
-    def branch_rts(insn, result: InstructionInfo):
-        result.add_branch(BranchType.FunctionReturn)
+    # Branch per opcode ID (or None), filled in below the class
+    by_id = ()
 
-    @staticmethod
-    def branch_rts_n(insn, result: InstructionInfo):
-        result.add_branch(BranchType.FunctionReturn)
+    @classmethod
+    def find_branches(cls, insn, result: InstructionInfo):
+        branch = cls.by_id[insn.opcode["id"]]
+        # Most instructions are not branches, their info is just the length
+        if branch is None:
+            return
 
-    @staticmethod
-    def branch_rtv_n(insn, result: InstructionInfo):
-        result.add_branch(BranchType.FunctionReturn)
+        if branch.has_target:
+            result.add_branch(branch.type, insn.operands[0].val)
+        else:
+            result.add_branch(branch.type)
+        if branch.fall_through is not None:
+            result.add_branch(BranchType.FalseBranch, insn.addr + branch.fall_through)
+        if branch.delay:
+            result.branch_delay = True
+
+Brancher.by_id = tuple(
+    Branch(*Brancher.BRANCHES[opcode["cmd"]], opcode["is_delay"])
+    if opcode["cmd"] in Brancher.BRANCHES else None
+    for opcode in OPCODES
+)
 
 class Lifter:
+    # lift_* method per opcode ID (or None), filled in below the class
+    by_id = ()
+
     @classmethod
     def lift(cls, il: LowLevelILFunction, insn: SHInsn):
-        func_name = 'lift_' + insn.opcode["cmd"].replace("/", "_").replace(".", "_")
-        if hasattr(cls, func_name):
-            getattr(cls, func_name)(il, insn)
+        lift_func = cls.by_id[insn.opcode["id"]]
+        if lift_func is not None and not insn.parallel:
+            lift_func(il, insn)
         else:
+            # SH-DSP data transfers are not lifted, so neither is anything
+            # that runs them in parallel (nopx movy.w is not a nop)
             il.append(il.unimplemented())
 
     @staticmethod
-    def _lift_op(il: LowLevelILFunction, insn: SHInsn, op: Oper, sign_ext=False):
+    def _lift_op(il: LowLevelILFunction, insn: SHInsn, op: SHOperand, sign_ext=False):
         il_op = None
 
         if op.type == OpType.REG:
@@ -204,58 +172,51 @@ class Lifter:
                 il_op = il.reg(RSIZE, op.reg)
         elif op.type == OpType.IMM or op.type == OpType.DISP:
             assert op.size != 0, f"Invalid instruction at: 0x{insn.addr:x}"
+            il_op = il.const(op.size, op.val)
 
-            if op.type == OpType.DISP and op.is_ref and op.is_pair:
-                # Fetch the next part of the pair
-                next_op = None
-                for i, cur_op in enumerate(insn.opcode["args"]):
-                    if cur_op.is_pair:
-                        next_op = insn.opcode["args"][i + 1]
-                        break
-                assert next_op is not None, f"Invalid instruction at: 0x{insn.addr:x}"
-                assert next_op.type == OpType.REG, f"Invalid instruction at: 0x{insn.addr:x}"
-
-                if next_op.reg == "PC":
-                    cur_il = il.shift_left(RSIZE,
-                        il.const(RSIZE, op.val),
-                        il.const(RSIZE, int(insn.opcode['width'] / 2))
-                    )
+        if sign_ext:
+            il_op = il.sign_extend(RSIZE, il_op)
 
-                    if insn.opcode["width"] == 4:
-                        next_il = il.and_expr(RSIZE,
-                            il.const(RSIZE, insn.addr),
-                            il.const(RSIZE, 0xFFFFFFFC)
-                        )
-                    else:
-                        next_il = il.const(RSIZE, insn.addr)
+        return il_op
 
-                    next_il = il.add(RSIZE,
-                        next_il,
-                        il.const(RSIZE, 4)
-                    )
+    @staticmethod
+    def _lift_addr(il: LowLevelILFunction, insn: SHInsn, mem: MemRef):
+        """Address of a memory operand, built once from its addressing mode"""
+        kind = mem.kind
 
-                else:
-                    cur_il = il.const(op.size, op.val)
-                    next_il = il.reg(RSIZE, next_op.reg)
+        if kind == AddrMode.DISP_PC:
+            return il.const(RSIZE, insn.ea)
 
-                il_op = il.add(RSIZE,
-                    cur_il,
-                    next_il
-                )
-            else:
-                il_op = il.const(op.size, op.val)
+        base = il.reg(RSIZE, insn.operands[mem.base].reg)
+        if kind == AddrMode.REG or kind == AddrMode.POST_INC or kind == AddrMode.PRE_DEC \
+                or kind == AddrMode.POST_INDEX:
+            return base
+        if kind == AddrMode.R0_REG or kind == AddrMode.R0_GBR:
+            return il.add(RSIZE, il.reg(RSIZE, insn.operands[mem.index].reg), base)
 
-        if sign_ext:
-            il_op = il.sign_extend(RSIZE, il_op)
+        disp = il.const(RSIZE, insn.operands[mem.disp].val * mem.scale)
+        if kind == AddrMode.DISP_TBR:
+            return il.load(RSIZE, il.add(RSIZE, base, disp))
+        return il.add(RSIZE, base, disp)
 
-        return il_op
+    @staticmethod
+    def _lift_step(il: LowLevelILFunction, insn: SHInsn, mem: MemRef, sign):
+        """Move the base register of an @Rn+ / @-Rn operand"""
+        reg = insn.operands[mem.base].reg
+        return il.set_reg(RSIZE,
+            reg,
+            il.add(RSIZE,
+                il.reg(RSIZE, reg),
+                il.const(RSIZE, sign * mem.step)
+            )
+        )
 
     @staticmethod
     def lift_mov(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        op_2 = insn.opcode["args"][1]
+        op_1 = insn.operands[0]
+        op_2 = insn.operands[1]
 
         extend = False
         if op_1.type == OpType.IMM:
@@ -270,10 +231,10 @@ class Lifter:
 
     @staticmethod
     def lift_movi20(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        op_2 = insn.opcode["args"][1]
+        op_1 = insn.operands[0]
+        op_2 = insn.operands[1]
 
         il.append(
             il.set_reg(RSIZE,
@@ -284,10 +245,10 @@ class Lifter:
 
     @staticmethod
     def lift_movi20s(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        op_2 = insn.opcode["args"][1]
+        op_1 = insn.operands[0]
+        op_2 = insn.operands[1]
 
         assert op_1.type == OpType.IMM, f"Invalid instruction at: 0x{insn.addr:x}"
         assert op_1.size != 0, f"Invalid instruction at: 0x{insn.addr:x}"
@@ -306,100 +267,114 @@ class Lifter:
 
     @staticmethod
     def lift_mova(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 3, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 3, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        op_2 = insn.opcode["args"][1]
-        op_3 = insn.opcode["args"][2]
+        op_3 = insn.operands[2]
 
         il.append(
             il.set_reg(RSIZE,
                 op_3.reg,
-                il.add(RSIZE,
-                    il.and_expr(RSIZE,
-                        il.reg(RSIZE, op_2.reg),
-                        il.const(RSIZE, 0xFFFFFFFC)
-                    ),
-                    il.add(RSIZE,
-                        il.const(RSIZE, 4),
-                        il.shift_left(RSIZE,
-                            il.const(RSIZE, op_1.val),
-                            il.const(RSIZE, 2)
-                        )
-                    )
-                )
+                il.const(RSIZE, insn.ea)
             )
         )
 
     @staticmethod
-    def lift_mov_b(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) > 1, f"Invalid instruction at: 0x{insn.addr:x}"
+    def _lift_move(il: LowLevelILFunction, insn: SHInsn, width):
+        assert len(insn.memory) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        if op_1.is_pair:
-            op_2 = insn.opcode["args"][2]
-        else:
-            op_2 = insn.opcode["args"][1]
+        mem = insn.memory[0]
+        size = max(width, RSIZE)
 
-        extra_op = None
+        if mem.arg == 0:
+            if mem.kind == AddrMode.PRE_DEC:
+                il.append(Lifter._lift_step(il, insn, mem, -1))
 
-        if op_1.is_ref:
-            il_op = il.set_reg(RSIZE,
-                op_2.reg,
-                il.load(insn.opcode["width"],
-                    Lifter._lift_op(il, insn, op_1)
+            # Load, the destination register follows the memory operand
+            dest = insn.operands[mem.arg + mem.count]
+            il.append(
+                il.set_reg(size,
+                    dest.reg,
+                    il.load(width,
+                        Lifter._lift_addr(il, insn, mem)
+                    )
                 )
             )
 
-            if op_1.mod_reg != 0:
-                if op_1.type == OpType.REG and op_2.type == OpType.REG and op_1.mod_reg > 0:
-                    extra_op = None
-                else:
-                    extra_op = il.set_reg(RSIZE,
-                        op_1.reg,
-                        il.add(RSIZE,
-                            il.reg(RSIZE, op_1.reg),
-                            il.const(RSIZE, op_1.mod_reg)
-                        )
-                    )
+            # @Rm+ into Rm keeps the loaded value
+            if mem.kind == AddrMode.POST_INC and dest.reg != insn.operands[mem.base].reg:
+                il.append(Lifter._lift_step(il, insn, mem, 1))
+        else:
+            src = insn.operands[0]
+            if src.type == OpType.REG:
+                value = il.reg(size, src.reg)
+            else:
+                value = Lifter._lift_op(il, insn, src)
 
-        elif op_2.is_ref:
-            il_op = il.store(insn.opcode["width"],
-                Lifter._lift_op(il, insn, op_2),
-                Lifter._lift_op(il, insn, op_1)
-            )
+            addr = Lifter._lift_addr(il, insn, mem)
+            if mem.kind == AddrMode.PRE_DEC:
+                # Store below Rn before moving it, so mov.l R15,@-R15 stores
+                # R15 as it was before the decrement
+                addr = il.sub(RSIZE, addr, il.const(RSIZE, mem.step))
 
-            if op_2.mod_reg != 0:
-                extra_op = il.set_reg(RSIZE,
-                    op_2.reg,
-                    il.add(RSIZE,
-                        il.reg(RSIZE, op_2.reg),
-                        il.const(RSIZE, op_2.mod_reg)
-                    )
+            il.append(
+                il.store(width,
+                    addr,
+                    value
                 )
+            )
 
-        else:
-            assert False, f"Invalid instruction at: 0x{insn.addr:x}"
-
-        il.append(il_op)
+            if mem.kind == AddrMode.POST_INC:
+                il.append(Lifter._lift_step(il, insn, mem, 1))
+            elif mem.kind == AddrMode.PRE_DEC:
+                il.append(Lifter._lift_step(il, insn, mem, -1))
 
-        if extra_op is not None:
-            il.append(extra_op)
+    @staticmethod
+    def lift_mov_b(il: LowLevelILFunction, insn: SHInsn):
+        Lifter._lift_move(il, insn, insn.opcode["width"])
 
     @staticmethod
     def lift_mov_w(il: LowLevelILFunction, insn: SHInsn):
-        Lifter.lift_mov_b(il, insn)
+        Lifter._lift_move(il, insn, insn.opcode["width"])
 
     @staticmethod
     def lift_mov_l(il: LowLevelILFunction, insn: SHInsn):
-        Lifter.lift_mov_b(il, insn)
+        Lifter._lift_move(il, insn, insn.opcode["width"])
+
+    @staticmethod
+    def lift_fmov_s(il: LowLevelILFunction, insn: SHInsn):
+        Lifter._lift_move(il, insn, 4)
+
+    @staticmethod
+    def lift_fmov_d(il: LowLevelILFunction, insn: SHInsn):
+        Lifter._lift_move(il, insn, 8)
+
+    @staticmethod
+    def lift_fmov(il: LowLevelILFunction, insn: SHInsn):
+        # FRn forms move 4 bytes, DRn / XDn pairs (FPSCR.SZ=1) move 8
+        size = 4
+        for op in insn.operands:
+            if op.fmt_str in PAIR_OPERANDS:
+                size = 8
+
+        if len(insn.memory) != 0:
+            Lifter._lift_move(il, insn, size)
+            return
+
+        assert len(insn.operands) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
+
+        il.append(
+            il.set_reg(size,
+                insn.operands[1].reg,
+                il.reg(size, insn.operands[0].reg)
+            )
+        )
 
     @staticmethod
     def lift_sub(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        op_2 = insn.opcode["args"][1]
+        op_1 = insn.operands[0]
+        op_2 = insn.operands[1]
 
         il.append(
             il.set_reg(RSIZE,
@@ -413,10 +388,10 @@ class Lifter:
 
     @staticmethod
     def lift_add(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        op_2 = insn.opcode["args"][1]
+        op_1 = insn.operands[0]
+        op_2 = insn.operands[1]
 
         il.append(
             il.set_reg(RSIZE,
@@ -430,10 +405,10 @@ class Lifter:
 
     @staticmethod
     def lift_cmp_eq(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        op_2 = insn.opcode["args"][1]
+        op_1 = insn.operands[0]
+        op_2 = insn.operands[1]
 
         extend = False
         if op_1.type == OpType.IMM:
@@ -472,10 +447,10 @@ class Lifter:
 
     @staticmethod
     def lift_tst(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 2, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
-        op_2 = insn.opcode["args"][1]
+        op_1 = insn.operands[0]
+        op_2 = insn.operands[1]
 
         t = LowLevelILLabel()
         f = LowLevelILLabel()
@@ -512,11 +487,11 @@ class Lifter:
 
     @staticmethod
     def lift_bf(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
+        op_1 = insn.operands[0]
 
-        t = il.get_label_for_address(Architecture["superh"], op_1.val)
+        t = il.get_label_for_address(il.arch, op_1.val)
 
         if t is None:
             t = LowLevelILLabel()
@@ -552,11 +527,11 @@ class Lifter:
 
     @staticmethod
     def lift_bt(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
+        op_1 = insn.operands[0]
 
-        t = il.get_label_for_address(Architecture["superh"], op_1.val)
+        t = il.get_label_for_address(il.arch, op_1.val)
 
         if t is None:
             t = LowLevelILLabel()
@@ -590,9 +565,9 @@ class Lifter:
 
     @staticmethod
     def lift_bra(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
+        op_1 = insn.operands[0]
 
         il.append(
             il.jump(il.const(RSIZE, op_1.val))
@@ -600,21 +575,24 @@ class Lifter:
 
     @staticmethod
     def lift_jsr(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
-
-        op_1 = insn.opcode["args"][0]
+        assert len(insn.memory) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
 
         il.append(
             il.call(
-                Lifter._lift_op(il, insn, op_1)
+                Lifter._lift_addr(il, insn, insn.memory[0])
             )
         )
 
+    @staticmethod
+    def lift_jsr_n(il: LowLevelILFunction, insn: SHInsn):
+        # jsr/n @Rm, or jsr/n @@(disp,TBR) through the TBR function table
+        Lifter.lift_jsr(il, insn)
+
     @staticmethod
     def lift_bsrf(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
+        assert len(insn.operands) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
 
-        op_1 = insn.opcode["args"][0]
+        op_1 = insn.operands[0]
 
         il.append(
             il.call(
@@ -630,13 +608,11 @@ class Lifter:
 
     @staticmethod
     def lift_jmp(il: LowLevelILFunction, insn: SHInsn):
-        assert len(insn.opcode["args"]) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
-
-        op_1 = insn.opcode["args"][0]
+        assert len(insn.memory) == 1, f"Invalid instruction at: 0x{insn.addr:x}"
 
         il.append(
             il.jump(
-                Lifter._lift_op(il, insn, op_1)
+                Lifter._lift_addr(il, insn, insn.memory[0])
             )
         )
 
@@ -650,6 +626,12 @@ class Lifter:
     def lift_nopy(il: LowLevelILFunction, insn: SHInsn):
         il.append(il.nop())
 
+# Resolved once per opcode instead of by name for every lifted instruction
+Lifter.by_id = tuple(
+    getattr(Lifter, 'lift_' + opcode["cmd"].replace("/", "_").replace(".", "_"), None)
+    for opcode in OPCODES
+)
+
 
 class SuperH(Architecture):
     name = "superh"
@@ -670,6 +652,21 @@ class SuperH(Architecture):
     for r in control_registers:
         regs[r] = RegisterInfo(r, RSIZE)
 
+    # FRn are the halves of the DRn pairs, which are the halves of the FVn
+    # vectors. XFn and XDn are the same view of XMTRX.
+    for r in VECTOR_REGS:
+        regs[r] = RegisterInfo(r, 16)
+    for i, r in enumerate(PAIR_REGS):
+        regs[r] = RegisterInfo(VECTOR_REGS[i // 2], 8, 8 - (i % 2) * 8)
+    for i, r in enumerate(FLOAT_REGS):
+        regs[r] = RegisterInfo(VECTOR_REGS[i // 4], 4, (3 - i % 4) * 4)
+
+    regs['XMTRX'] = RegisterInfo('XMTRX', 64)
+    for i, r in enumerate(EXTENDED_PAIR_REGS):
+        regs[r] = RegisterInfo('XMTRX', 8, (7 - i) * 8)
+    for i, r in enumerate(EXTENDED_REGS):
+        regs[r] = RegisterInfo('XMTRX', 4, (15 - i) * 4)
+
     flags = ['t']
     flag_roles = {
         't': FlagRole.SpecialFlagRole
@@ -680,14 +677,45 @@ class SuperH(Architecture):
 
     system_regs = system_registers + control_registers
 
+    # FPSCR.SZ/PR state the FPU encodings are decoded in and the ISA variant
+    # whose opcodes are decoded (None for all of them), see the subclasses
+    # below
+    fpu_mode = 0
+    variant = None
+
     def __init__(self):
         super().__init__()
+        self.decoders = variant_decoders(self.variant)
+        if self.endianness == Endianness.BigEndian:
+            disasm = disasm_single_be
+        else:
+            disasm = disasm_single
+
+        # Binary Ninja asks for the info, text and IL of every instruction
+        # separately, and again on each re-analysis: decode every address
+        # once for all of them
+        self._disasm = functools.partial(
+            disasm, mode=self.fpu_mode, decoders=self.decoders
+        )
+        self.use_decode_cache(_DECODE_CACHE)
+        _INSTANCES.append(self)
+
+    def use_decode_cache(self, cache):
+        """Decode through a DecodeCache, or directly again if cache is None
+
+        Starts a fresh decode memo, entries decoded the other way are dropped.
+        """
+        if cache is None:
+            decode = self._disasm
+        else:
+            decode = functools.partial(self._disasm, decode=cache)
+        self.decode = DecodeMemo(decode)
 
     def get_instruction_info(self, data, addr):
         result = InstructionInfo()
         result.length = ISIZE
 
-        insn = disasm_single(data, addr)
+        insn = self.decode(data, addr)
 
         if not insn:
             return result
@@ -699,7 +727,7 @@ class SuperH(Architecture):
 
     def get_instruction_text(self, data, addr):
         tokens = list()
-        insn = disasm_single(data, addr)
+        insn = self.decode(data, addr)
 
         if not insn:
             tokens.append(InstructionTextToken(InstructionTextTokenType.TextToken, "<unknown>"))
@@ -711,7 +739,7 @@ class SuperH(Architecture):
         return tokens, insn.size
 
     def get_instruction_low_level_il(self, data, addr, il):
-        insn = disasm_single(data, addr)
+        insn = self.decode(data, addr)
 
         if not insn:
             il.append(il.unimplemented())
@@ -720,3 +748,128 @@ class SuperH(Architecture):
         Lifter.lift(il, insn)
 
         return insn.size
+
+
+# The same architecture with FPSCR.PR and/or FPSCR.SZ set. Binary Ninja
+# keeps an architecture per function, so double precision or pair move code
+# is decoded correctly by creating its functions with one of these.
+class SuperHPR(SuperH):
+    name = "superh-pr"
+    fpu_mode = MODE_PR
+
+
+class SuperHSZ(SuperH):
+    name = "superh-sz"
+    fpu_mode = MODE_SZ
+
+
+class SuperHSZPR(SuperH):
+    name = "superh-sz-pr"
+    fpu_mode = MODE_SZ | MODE_PR
+
+
+# One architecture per core, decoding only the instructions it has
+class SH1(SuperH):
+    name = "sh1"
+    variant = "SH1"
+
+
+class SH2(SuperH):
+    name = "sh2"
+    variant = "SH2"
+
+
+class SH2A(SuperH):
+    name = "sh2a"
+    variant = "SH2A"
+
+
+class SH3(SuperH):
+    name = "sh3"
+    variant = "SH3"
+
+
+class SH4(SuperH):
+    name = "sh4"
+    variant = "SH4"
+
+
+class SH4A(SuperH):
+    name = "sh4a"
+    variant = "SH4A"
+
+
+class SHDSP(SuperH):
+    name = "sh-dsp"
+    variant = "DSP"
+
+
+def _fpu_mode(arch_class, suffix, mode):
+    """arch_class decoding in FPU mode, named <name>-<suffix>"""
+    class FPUMode(arch_class):
+        name = arch_class.name + "-" + suffix
+        fpu_mode = mode
+
+    FPUMode.__name__ = FPUMode.__qualname__ = \
+        arch_class.__name__ + suffix.replace("-", "").upper()
+    return FPUMode
+
+
+# The cores with pair FPU forms also get an architecture per FPU mode
+# (sh4-pr, sh4-sz, sh4-sz-pr, ...), the others decode the same in every mode
+FPU_MODE_ARCHITECTURES = tuple(
+    _fpu_mode(arch_class, suffix, mode)
+    for arch_class in (SH2A, SH4, SH4A)
+    for suffix, mode in (("pr", MODE_PR), ("sz", MODE_SZ), ("sz-pr", MODE_SZ | MODE_PR))
+)
+
+ARCHITECTURES = (
+    SuperH, SuperHPR, SuperHSZ, SuperHSZPR,
+    SH1, SH2, SH2A, SH3, SH4, SH4A, SHDSP
+) + FPU_MODE_ARCHITECTURES
+
+
+def _big_endian(arch_class):
+    """Big-endian twin of arch_class, named <name>-be"""
+    class BigEndian(arch_class):
+        name = arch_class.name + "-be"
+        endianness = Endianness.BigEndian
+
+    BigEndian.__name__ = BigEndian.__qualname__ = arch_class.__name__ + "BE"
+    return BigEndian
+
+
+# SuperH is bi-endian, Saturn and most SH-2 engine controllers run big-endian
+BIG_ENDIAN_ARCHITECTURES = tuple(_big_endian(arch_class) for arch_class in ARCHITECTURES)
+
+# Every architecture instance, see memo_stats() and enable_decode_cache()
+_INSTANCES = list()
+_DECODE_CACHE = None
+
+def memo_stats():
+    """MemoStats summed over the decode memos of all architectures
+
+    misses is the number of instructions actually decoded, hits + misses
+    the number of decodes the callbacks asked for.
+    """
+    hits = misses = slots = 0
+    for arch in _INSTANCES:
+        stats = arch.decode.stats()
+        hits += stats.hits
+        misses += stats.misses
+        slots += stats.slots
+    return MemoStats(hits, misses, slots)
+
+def enable_decode_cache(maxsize=4096):
+    """Route the decodes of all architectures through one shared DecodeCache
+
+    Off by default: a miss pays for the LRU lookup on top of the decode, and
+    on images whose words rarely repeat the cached sweep of bench-disasm.py
+    runs at about half the speed of the plain one. Returns the cache, its
+    stats() show whether it pays off on the loaded image.
+    """
+    global _DECODE_CACHE
+    cache = _DECODE_CACHE = DecodeCache(maxsize)
+    for arch in _INSTANCES:
+        arch.use_decode_cache(cache)
+    return cache